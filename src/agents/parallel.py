@@ -1,4 +1,4 @@
-"""Agents used by the parallel/hierarchical collaborative workflow."""
+"""Agents used by the parallel collaborative workflow."""
 
 from __future__ import annotations
 
@@ -38,7 +38,7 @@ def build_parallel_agents(settings: Settings) -> ParallelAgents:
         collab_tools = make_collab_toolset()
         common_tools = collab_tools + make_default_tools(settings, temperature=0.6)
 
-        common = dict(llm=llm, tools=common_tools, verbose=True, memory=True)
+        common = dict(llm=llm, tools=common_tools, verbose=settings.verbose, memory=True)
 
         frontend = Agent(
             role="Frontend Developer",
@@ -47,7 +47,7 @@ def build_parallel_agents(settings: Settings) -> ParallelAgents:
                 "Expert in Python GUI development with tkinter. Communicates "
                 "progress proactively and integrates with backend APIs as they evolve."
             ),
-            allow_delegation=True,
+            allow_delegation=False,
             max_iter=10,
             **common,
         )
@@ -59,7 +59,7 @@ def build_parallel_agents(settings: Settings) -> ParallelAgents:
                 "Backend specialist focused on game engines, resource management, "
                 "and stable interfaces for the frontend."
             ),
-            allow_delegation=True,
+            allow_delegation=False,
             max_iter=10,
             **common,
         )
@@ -71,7 +71,7 @@ def build_parallel_agents(settings: Settings) -> ParallelAgents:
                 "Integration specialist who watches all components, identifies "
                 "integration points, and brokers between teams."
             ),
-            allow_delegation=True,
+            allow_delegation=False,
             max_iter=15,
             **common,
         )
@@ -80,7 +80,7 @@ def build_parallel_agents(settings: Settings) -> ParallelAgents:
             role="QA Engineer",
             goal="Continuously test components and feed back issues to developers.",
             backstory="QA engineer running parallel tests against new components as they land.",
-            allow_delegation=True,
+            allow_delegation=False,
             max_iter=8,
             **common,
         )
@@ -89,7 +89,7 @@ def build_parallel_agents(settings: Settings) -> ParallelAgents:
             role="Performance Engineer",
             goal="Profile and optimize the game's runtime characteristics.",
             backstory="Performance specialist analyzing CPU, memory, and rendering hot paths.",
-            allow_delegation=True,
+            allow_delegation=False,
             max_iter=6,
             **common,
         )
@@ -101,7 +101,7 @@ def build_parallel_agents(settings: Settings) -> ParallelAgents:
                 "Specialist in coordinating file-level locks across the team. "
                 "Maintains audit trails and prevents lost writes."
             ),
-            allow_delegation=True,
+            allow_delegation=False,
             max_iter=8,
             **common,
         )
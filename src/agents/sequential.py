@@ -29,10 +29,10 @@ def build_sequential_agents(settings: Settings) -> SequentialAgents:
         qa_llm = make_llm(settings, temperature=0.3)
         devops_llm = make_llm(settings, temperature=0.4)
 
-        senior_tools = make_default_tools(settings, temperature=0.5)
-        junior_tools = make_default_tools(settings, temperature=0.7)
-        qa_tools = make_default_tools(settings, temperature=0.3)
-        devops_tools = make_default_tools(settings, temperature=0.4)
+        # One toolset for the whole crew: each CodeDocsSearchTool builds and
+        # embeds its own docs index, and only its summarizer temperature
+        # differed between agents.
+        tools = make_default_tools(settings, temperature=0.5)
 
         senior = Agent(
             role="Senior Game Architect",
@@ -46,9 +46,9 @@ def build_sequential_agents(settings: Settings) -> SequentialAgents:
                 "systems, achievements, and balance design."
             ),
             llm=senior_llm,
-            tools=senior_tools,
+            tools=tools,
             allow_delegation=True,
-            verbose=True,
+            verbose=settings.verbose,
             memory=True,
             max_iter=25,
         )
@@ -61,9 +61,9 @@ def build_sequential_agents(settings: Settings) -> SequentialAgents:
                 "and tkinter/pygame experience. Writes clean, documented code."
             ),
             llm=junior_llm,
-            tools=junior_tools,
+            tools=tools,
             allow_delegation=False,
-            verbose=True,
+            verbose=settings.verbose,
             memory=True,
             max_iter=25,
         )
@@ -76,9 +76,9 @@ def build_sequential_agents(settings: Settings) -> SequentialAgents:
                 "progression, save/load, performance, and edge cases."
             ),
             llm=qa_llm,
-            tools=qa_tools,
+            tools=tools,
             allow_delegation=False,
-            verbose=True,
+            verbose=settings.verbose,
             memory=True,
             max_iter=15,
         )
@@ -91,9 +91,9 @@ def build_sequential_agents(settings: Settings) -> SequentialAgents:
                 "executable builds, installers, auto-updaters, release pipelines."
             ),
             llm=devops_llm,
-            tools=devops_tools,
+            tools=tools,
             allow_delegation=False,
-            verbose=True,
+            verbose=settings.verbose,
             memory=True,
             max_iter=15,
         )
@@ -4,7 +4,7 @@ Single CLI entrypoint with an interactive menu.
 Usage:
     python -m src.cli                    # interactive menu
     python -m src.cli --mode sequential  # run sequential crew
-    python -m src.cli --mode parallel    # run parallel/hierarchical crew
+    python -m src.cli --mode parallel    # run parallel collaborative crews
     python -m src.cli --mode dashboard   # launch dashboard only
     python -m src.cli --mode full        # launch dashboard + agents (parallel)
 """
@@ -12,38 +12,45 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import signal
 import sys
 from datetime import datetime
 from typing import Callable
 
 from .comms import default_hub
 from .config import Settings
-from .crew import build_parallel_crew, build_sequential_crew, default_inputs
 from .errors import Codes, ConfigError, CrewAIError
 from .logging_setup import get_logger, setup_logging
 
 MODES = {
     "1": ("sequential", "Sequential development (4 agents, simple, fastest)"),
-    "2": ("parallel", "Parallel collaborative (6 agents, hierarchical)"),
+    "2": ("parallel", "Parallel collaborative (6 agents, concurrent)"),
     "3": ("dashboard", "Dashboard only (monitor an existing run)"),
     "4": ("full", "Full launch (parallel agents + live dashboard)"),
     "5": ("exit", "Exit"),
 }
 
 
-def _print_banner() -> None:
-    print("=" * 64)
-    print(" CrewAI Idle Game Development Workbench")
-    print(" v2.0  |  unified launcher")
-    print("=" * 64)
+_BANNER = "\n".join(
+    [
+        "=" * 64,
+        " CrewAI Idle Game Development Workbench",
+        " v2.0  |  unified launcher",
+        "=" * 64,
+        "",
+        "Select a mode:",
+        *(f"  {key}) {label}" for key, (_, label) in MODES.items()),
+        "",
+        "",
+    ]
+)
 
 
 def _print_menu() -> None:
-    print()
-    print("Select a mode:")
-    for key, (_, label) in MODES.items():
-        print(f"  {key}) {label}")
-    print()
+    # One write for the whole screen rather than a print (and a stdout
+    # lock round trip) per line.
+    sys.stdout.write(_BANNER)
+    sys.stdout.flush()
 
 
 def _prompt_mode() -> str:
@@ -55,6 +62,10 @@ def _prompt_mode() -> str:
 
 
 def _run_sequential(settings: Settings) -> int:
+    # crew pulls in crewai, litellm and the embedding SDKs; only the crew
+    # modes pay for that import.
+    from .crew import build_sequential_crew, default_inputs
+
     logger = get_logger(__name__)
     logger.info("starting sequential crew")
     bundle = build_sequential_crew(settings)
@@ -66,13 +77,15 @@ def _run_sequential(settings: Settings) -> int:
 
 
 def _run_parallel(settings: Settings) -> int:
+    from .crew import build_parallel_crew, default_inputs
+
     logger = get_logger(__name__)
     logger.info("starting parallel crew")
     bundle = build_parallel_crew(settings)
-    result = bundle.kickoff(default_inputs(settings))
+    results = bundle.kickoff(default_inputs(settings))
     logger.info("parallel crew finished")
     print("\n=== RESULT ===\n")
-    print(result)
+    print("\n\n".join(str(result) for result in results))
     return 0
 
 
@@ -99,6 +112,12 @@ DISPATCH: dict[str, Callable[[Settings], int]] = {
 }
 
 
+def _exit_on_sigterm(signum: int, _frame: object) -> None:
+    # The dashboard's Stop sends SIGTERM, whose default action skips atexit
+    # and with it the flush of the buffered log file.
+    raise SystemExit(128 + signum)
+
+
 def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(prog="crewai-cli", description="CrewAI development workbench")
     parser.add_argument("--mode", choices=sorted(DISPATCH.keys()) + ["menu"], default="menu")
@@ -122,11 +141,12 @@ def main(argv: list[str] | None = None) -> int:
     setup_logging(
         level=args.log_level or settings.log_level,
         log_file=args.log_file or settings.log_file,
+        console=settings.force_console_log or sys.stdout.isatty(),
     )
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
     logger = get_logger(__name__)
 
     if args.mode == "menu" and not args.no_menu:
-        _print_banner()
         _print_menu()
         try:
             mode = _prompt_mode()
@@ -15,20 +15,30 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
 import portalocker
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json produces the same file
+    orjson = None
+
 from .errors import Codes, CommunicationError, FileLockError
 from .logging_setup import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 DEFAULT_STATE: dict[str, Any] = {
     "communications": [],
     "status_updates": [],
@@ -39,24 +49,121 @@ DEFAULT_STATE: dict[str, Any] = {
 }
 
 
+# mtime resolution is coarse on some filesystems (2s on FAT); a file written
+# more recently than this may change again without its mtime moving.
+_RACY_NS = 2_000_000_000
+
+# Upper bound on remembered messages before expired ones are pruned.
+_RECENT_MAX = 256
+
+
+@dataclass(frozen=True, slots=True)
+class IntegrationPoint:
+    """Flattened integration point used by the in-memory dependency index."""
+
+    agent: str
+    component: str
+    dependencies: frozenset[str]
+
+
+def _index_dependencies(data: dict[str, Any]) -> dict[str, list[IntegrationPoint]]:
+    index: dict[str, list[IntegrationPoint]] = {}
+    for point in data.get("integration_points", []):
+        deps = (point.get("interface") or {}).get("dependencies", []) or []
+        record = IntegrationPoint(
+            agent=point.get("agent", "?"),
+            component=point.get("component", "?"),
+            dependencies=frozenset(d for d in deps if isinstance(d, str)),
+        )
+        for dep in record.dependencies:
+            index.setdefault(dep, []).append(record)
+    return index
+
+
+def _latest_per_agent(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    latest: dict[str, dict[str, Any]] = {}
+    for update in data.get("status_updates", []):
+        agent = update.get("agent")
+        if agent:
+            latest[agent] = update
+    return latest
+
+
+def _log_notify_failure(future: Future[str]) -> None:
+    exc = future.exception()
+    if exc is not None:
+        logger.error("background notification failed: %s", exc)
+
+
 def _utcnow() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+if orjson is not None:
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+else:
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        # Compact on purpose: the file is rewritten on every mutation, and
+        # indent=2 made each write several times slower and larger.
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+
 @dataclass
 class CommunicationHub:
     state_file: Path = field(default_factory=lambda: Path("Game/shared/agent_communication.json"))
     max_status_updates: int = 200
     max_communications: int = 1000
+    max_integration_points: int = 500
+    max_conflict_reports: int = 500
+    _cache: tuple[tuple[int, int, int], dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    dedup_window_s: float = 0.5
+    _recent: dict[tuple[Any, ...], tuple[float, str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Agent threads send concurrently; _recent is read, pruned and replaced.
+    _recent_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    # Single worker so queued notifications are written in submission order.
+    # Its thread is only started on first use.
+    _notifier: ThreadPoolExecutor = field(
+        default_factory=lambda: ThreadPoolExecutor(max_workers=1, thread_name_prefix="hub-notify"),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _views: dict[str, tuple[dict[str, Any], Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # State dict of the batch() open on the current thread, if any, and the
+    # dedup entries it has claimed.
+    _batch: threading.local = field(
+        default_factory=threading.local, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         self.state_file = Path(self.state_file)
         try:
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            if not self.state_file.exists():
-                self._atomic_write(DEFAULT_STATE)
-            else:
+            # Warm starts find the file already there; only touch the
+            # directory tree when it's missing.
+            try:
                 self._heal()
+            except FileNotFoundError:
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                self._atomic_write(DEFAULT_STATE)
         except OSError as exc:
             raise CommunicationError(
                 "failed to initialize communication state",
@@ -69,15 +176,21 @@ class CommunicationHub:
     @contextmanager
     def _exclusive(self) -> Iterator[dict[str, Any]]:
         """Read-modify-write under a single exclusive lock."""
+        pending = getattr(self._batch, "data", None)
+        if pending is not None:
+            # Inside batch(): mutate the batch's copy; it's written once
+            # when the batch closes.
+            yield pending
+            return
         try:
-            with open(self.state_file, "r+", encoding="utf-8") as fh:
+            with open(self.state_file, "r+b") as fh:
                 portalocker.lock(fh, portalocker.LOCK_EX)
                 try:
                     raw = fh.read()
-                    data = json.loads(raw) if raw.strip() else dict(DEFAULT_STATE)
+                    data = _loads(raw) if raw.strip() else dict(DEFAULT_STATE)
                     yield data
                     fh.seek(0)
-                    json.dump(data, fh, indent=2, ensure_ascii=False)
+                    fh.write(_dumps(data))
                     fh.truncate()
                 finally:
                     portalocker.unlock(fh)
@@ -103,12 +216,37 @@ class CommunicationHub:
                 context={"path": str(self.state_file)},
             ) from exc
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Apply every hub write made in the block with one read-modify-write.
+
+        The state file stays locked for the whole block, so keep it to hub
+        calls. Reads on the same thread are served from the batch's copy,
+        pending writes included, without touching the file. Nothing is
+        written if the block raises. Nested batches join the outer one.
+        """
+        if getattr(self._batch, "data", None) is not None:
+            yield
+            return
+        claimed: list[tuple[tuple[Any, ...], str]] = []
+        try:
+            with self._exclusive() as data:
+                self._batch.data, self._batch.claimed = data, claimed
+                try:
+                    yield
+                finally:
+                    self._batch.data = self._batch.claimed = None
+        except BaseException:
+            # Nothing was written, so a retry must not be handed these ids.
+            self._forget(claimed)
+            raise
+
     def _atomic_write(self, data: dict[str, Any]) -> None:
         tmp = self.state_file.with_suffix(self.state_file.suffix + ".tmp")
-        with open(tmp, "w", encoding="utf-8") as fh:
+        with open(tmp, "wb") as fh:
             portalocker.lock(fh, portalocker.LOCK_EX)
             try:
-                json.dump(data, fh, indent=2, ensure_ascii=False)
+                fh.write(_dumps(data))
             finally:
                 portalocker.unlock(fh)
         os.replace(tmp, self.state_file)
@@ -116,13 +254,14 @@ class CommunicationHub:
     def _heal(self) -> None:
         """Ensure all required keys exist; recreate file if it's corrupt."""
         try:
-            with open(self.state_file, "r", encoding="utf-8") as fh:
+            with open(self.state_file, "rb") as fh:
                 portalocker.lock(fh, portalocker.LOCK_SH)
                 try:
+                    st = os.fstat(fh.fileno())
                     raw = fh.read()
                 finally:
                     portalocker.unlock(fh)
-            data = json.loads(raw) if raw.strip() else {}
+            data = _loads(raw) if raw.strip() else {}
         except json.JSONDecodeError:
             logger.warning("state file corrupt, recreating: %s", self.state_file)
             self._atomic_write(DEFAULT_STATE)
@@ -135,14 +274,50 @@ class CommunicationHub:
                 added = True
         if added:
             self._atomic_write(data)
+        elif time.time_ns() - st.st_mtime_ns > _RACY_NS:
+            # A healthy file was left as-is; hand the parse to the first
+            # snapshot() instead of reading it again.
+            self._cache = ((st.st_ino, st.st_mtime_ns, st.st_size), data)
 
     # ---- public read API ----
+    def state_token(self) -> tuple[int, int, int]:
+        """Cheap change marker for the state file: (inode, mtime_ns, size).
+
+        Every mutation rewrites the file, so an unchanged token means the
+        contents are unchanged (see ``snapshot`` for the racy case).
+        """
+        try:
+            st = os.stat(self.state_file)
+        except OSError as exc:
+            raise CommunicationError(
+                "failed to stat communication state",
+                code=Codes.COMM_READ_FAILED,
+                cause=exc,
+                context={"path": str(self.state_file)},
+            ) from exc
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
     def snapshot(self) -> dict[str, Any]:
+        """Parsed state file, reused while the file is unchanged.
+
+        The returned dict may be shared with other callers; treat it as
+        read-only. Inside ``batch()`` this is the batch's working copy. The
+        ``get_*`` getters below hand out copies instead.
+        """
+        pending = getattr(self._batch, "data", None)
+        if pending is not None:
+            # The batch holds LOCK_EX on the file; asking for LOCK_SH on a
+            # second fd would block on ourselves.
+            return pending
+        token = self.state_token()
+        cached = self._cache
+        if cached is not None and cached[0] == token:
+            return cached[1]
         try:
-            with open(self.state_file, "r", encoding="utf-8") as fh:
+            with open(self.state_file, "rb") as fh:
                 portalocker.lock(fh, portalocker.LOCK_SH)
                 try:
-                    return json.load(fh)
+                    data = _loads(fh.read())
                 finally:
                     portalocker.unlock(fh)
         except (OSError, json.JSONDecodeError) as exc:
@@ -152,74 +327,201 @@ class CommunicationHub:
                 cause=exc,
                 context={"path": str(self.state_file)},
             ) from exc
+        # The token is taken before the read, so a write racing the read can
+        # only make the cache look older than it is, never newer. A file
+        # written within the filesystem's timestamp granularity could still
+        # change again without moving mtime, so those aren't cached.
+        if time.time_ns() - token[1] > _RACY_NS:
+            self._cache = (token, data)
+        return data
+
+    def _derived(self, name: str, build: Callable[[dict[str, Any]], T]) -> T:
+        """Build a view of the snapshot once per parsed snapshot."""
+        data = self.snapshot()
+        if data is getattr(self._batch, "data", None):
+            # Mutated in place as the batch goes on; never cache it.
+            return build(data)
+        cached = self._views.get(name)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        value = build(data)
+        self._views[name] = (data, value)
+        return value
 
     # ---- messaging ----
     def send_message(self, sender: str, recipient: str, message: str, kind: str = "info") -> str:
+        self._check_message(sender, recipient, message)
+        key = (sender, recipient, message, kind)
+        msg_id, fresh = self._claim(key)
+        if not fresh:
+            return msg_id
+        with self._claimed(key, msg_id), self._exclusive() as data:
+            self._append_message(data, msg_id, sender, recipient, message, kind)
+        logger.info("message %s -> %s: %.80s", sender, recipient, message)
+        return msg_id
+
+    def announce(
+        self,
+        agent: str,
+        status: str,
+        message: str,
+        *,
+        kind: str = "info",
+        details: dict[str, Any] | None = None,
+        recipient: str = "all",
+    ) -> str:
+        """Record a status update and send a message in a single write."""
+        self._check_status(agent, status)
+        self._check_message(agent, recipient, message)
+        # A changed status or details is news even when the message repeats.
+        key = (agent, recipient, message, kind, status, _dumps(details) if details else b"")
+        msg_id, fresh = self._claim(key)
+        if not fresh:
+            return msg_id
+        with self._claimed(key, msg_id), self._exclusive() as data:
+            self._append_status(data, agent, status, details)
+            self._append_message(data, msg_id, agent, recipient, message, kind)
+        logger.info("message %s -> %s: %.80s", agent, recipient, message)
+        return msg_id
+
+    def _claim(self, key: tuple[Any, ...]) -> tuple[str, bool]:
+        """Reserve a message id for ``key``; ``(id, False)`` if it's a duplicate.
+
+        A burst of identical notifications (e.g. the file writer announcing
+        the same file rewritten several times in a row) collapses into the
+        first one sent within ``dedup_window_s``. Check and reservation
+        happen under one lock, so concurrent senders can't both miss.
+        """
+        now = time.monotonic()
+        with self._recent_lock:
+            seen = self._recent.get(key)
+            if seen is not None and now - seen[0] < self.dedup_window_s:
+                logger.debug("duplicate message %s -> %s suppressed", key[0], key[1])
+                return seen[1], False
+            if len(self._recent) >= _RECENT_MAX:
+                self._recent = {
+                    k: v for k, v in self._recent.items() if now - v[0] < self.dedup_window_s
+                }
+            msg_id = str(uuid.uuid4())
+            self._recent[key] = (now, msg_id)
+        claimed = getattr(self._batch, "claimed", None)
+        if claimed is not None:
+            claimed.append((key, msg_id))
+        return msg_id, True
+
+    @contextmanager
+    def _claimed(self, key: tuple[Any, ...], msg_id: str) -> Iterator[None]:
+        """Release the claim on ``key`` if the write that follows it fails."""
+        try:
+            yield
+        except BaseException:
+            self._forget([(key, msg_id)])
+            raise
+
+    def _forget(self, claims: Iterable[tuple[tuple[Any, ...], str]]) -> None:
+        with self._recent_lock:
+            for key, msg_id in claims:
+                seen = self._recent.get(key)
+                if seen is not None and seen[1] == msg_id:
+                    del self._recent[key]
+
+    def announce_later(self, agent: str, status: str, message: str, **kwargs: Any) -> Future[str]:
+        """Queue ``announce`` on the hub's background thread.
+
+        For notifications the caller doesn't need persisted before it
+        returns. Failures are logged rather than raised.
+        """
+        future = self._notifier.submit(self.announce, agent, status, message, **kwargs)
+        future.add_done_callback(_log_notify_failure)
+        return future
+
+    @staticmethod
+    def _check_message(sender: str, recipient: str, message: str) -> None:
         if not sender or not recipient or not message:
             raise CommunicationError(
                 "send_message requires sender, recipient, message",
                 code=Codes.COMM_INVALID_PAYLOAD,
                 context={"sender": sender, "recipient": recipient},
             )
-        msg_id = str(uuid.uuid4())
-        with self._exclusive() as data:
-            data["communications"].append(
-                {
-                    "id": msg_id,
-                    "timestamp": _utcnow(),
-                    "from_agent": sender,
-                    "to_agent": recipient,
-                    "message": message,
-                    "type": kind,
-                    "read": False,
-                }
-            )
-            if len(data["communications"]) > self.max_communications:
-                data["communications"] = data["communications"][-self.max_communications :]
-        logger.info("message %s -> %s: %s", sender, recipient, message[:80])
-        return msg_id
+
+    def _append_message(
+        self, data: dict[str, Any], msg_id: str, sender: str, recipient: str, message: str, kind: str
+    ) -> None:
+        data["communications"].append(
+            {
+                "id": msg_id,
+                "timestamp": _utcnow(),
+                "from_agent": sender,
+                "to_agent": recipient,
+                "message": message,
+                "type": kind,
+                "read": False,
+            }
+        )
+        if len(data["communications"]) > self.max_communications:
+            data["communications"] = data["communications"][-self.max_communications :]
 
     def get_messages(self, recipient: str, *, unread_only: bool = True) -> list[dict[str, Any]]:
         data = self.snapshot()
         return [
-            m
+            dict(m)
             for m in data.get("communications", [])
             if m.get("to_agent") == recipient and (not unread_only or not m.get("read"))
         ]
 
     def mark_read(self, message_id: str) -> bool:
+        return self.mark_messages_read([message_id]) > 0
+
+    def mark_messages_read(self, message_ids: Iterable[str]) -> int:
+        """Flag every message in ``message_ids`` as read in one write."""
+        wanted = set(message_ids)
+        if not wanted:
+            return 0
+        marked = 0
         with self._exclusive() as data:
             for m in data.get("communications", []):
-                if m.get("id") == message_id:
+                if m.get("id") in wanted:
                     m["read"] = True
-                    return True
-        return False
+                    marked += 1
+        return marked
 
     # ---- status ----
     def update_status(self, agent: str, status: str, details: dict[str, Any] | None = None) -> None:
+        self._check_status(agent, status)
+        with self._exclusive() as data:
+            self._append_status(data, agent, status, details)
+
+    @staticmethod
+    def _check_status(agent: str, status: str) -> None:
         if not agent or not status:
             raise CommunicationError(
                 "update_status requires agent and status",
                 code=Codes.COMM_INVALID_PAYLOAD,
             )
-        with self._exclusive() as data:
-            data["status_updates"].append(
-                {
-                    "timestamp": _utcnow(),
-                    "agent": agent,
-                    "status": status,
-                    "details": details or {},
-                }
-            )
-            if len(data["status_updates"]) > self.max_status_updates:
-                data["status_updates"] = data["status_updates"][-self.max_status_updates :]
+
+    def _append_status(
+        self, data: dict[str, Any], agent: str, status: str, details: dict[str, Any] | None
+    ) -> None:
+        data["status_updates"].append(
+            {
+                "timestamp": _utcnow(),
+                "agent": agent,
+                "status": status,
+                "details": details or {},
+            }
+        )
+        if len(data["status_updates"]) > self.max_status_updates:
+            data["status_updates"] = data["status_updates"][-self.max_status_updates :]
+
+    def latest_status(self) -> dict[str, dict[str, Any]]:
+        """Most recent status update per agent, rebuilt only when the file changes."""
+        latest = self._derived("latest_status", _latest_per_agent)
+        return {agent: dict(update) for agent, update in latest.items()}
 
     def get_status(self, agent: str | None = None) -> list[dict[str, Any]]:
         data = self.snapshot()
         updates = data.get("status_updates", [])
-        if agent is None:
-            return updates
-        return [u for u in updates if u.get("agent") == agent]
+        return [dict(u) for u in updates if agent is None or u.get("agent") == agent]
 
     # ---- shared context ----
     def set_context(self, key: str, value: Any) -> None:
@@ -229,7 +531,7 @@ class CommunicationHub:
     def get_context(self, key: str | None = None) -> Any:
         data = self.snapshot()
         ctx = data.get("shared_context", {})
-        return ctx if key is None else ctx.get(key)
+        return dict(ctx) if key is None else ctx.get(key)
 
     # ---- file locks (single API) ----
     def acquire_lock(self, agent: str, file_path: str) -> bool:
@@ -251,6 +553,10 @@ class CommunicationHub:
                 return True
         return False
 
+    def get_file_locks(self) -> dict[str, dict[str, Any]]:
+        data = self.snapshot()
+        return {path: dict(info) for path, info in data.get("file_locks", {}).items()}
+
     def lock_holder(self, file_path: str) -> str | None:
         data = self.snapshot()
         info = data.get("file_locks", {}).get(file_path)
@@ -281,6 +587,12 @@ class CommunicationHub:
                     "interface": interface,
                 }
             )
+            if len(data["integration_points"]) > self.max_integration_points:
+                data["integration_points"] = data["integration_points"][-self.max_integration_points :]
+
+    def points_depending_on(self, component: str) -> list[IntegrationPoint]:
+        """Integration points that list ``component`` among their dependencies."""
+        return list(self._derived("dependency_index", _index_dependencies).get(component, ()))
 
     def report_conflict(self, agent: str, description: str, details: dict[str, Any] | None = None) -> None:
         with self._exclusive() as data:
@@ -292,13 +604,22 @@ class CommunicationHub:
                     "details": details or {},
                 }
             )
+            if len(data["conflict_reports"]) > self.max_conflict_reports:
+                data["conflict_reports"] = data["conflict_reports"][-self.max_conflict_reports :]
 
 
 _default_hub: CommunicationHub | None = None
+_default_hub_lock = threading.Lock()
 
 
 def default_hub() -> CommunicationHub:
+    # Parallel crews call this from several threads at once; only the first
+    # caller pays for the lock and builds the hub.
     global _default_hub
-    if _default_hub is None:
-        _default_hub = CommunicationHub()
-    return _default_hub
+    hub = _default_hub
+    if hub is None:
+        with _default_hub_lock:
+            hub = _default_hub
+            if hub is None:
+                hub = _default_hub = CommunicationHub()
+    return hub
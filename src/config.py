@@ -41,6 +41,11 @@ def _optional(name: str, default: str) -> str:
     return default if value is None or value.strip() == "" else value
 
 
+def _flag(name: str, default: bool) -> bool:
+    value = _optional(name, "1" if default else "0")
+    return value.strip().lower() not in {"0", "false", "no", "off"}
+
+
 @dataclass(frozen=True)
 class Settings:
     gemini_api_key: str
@@ -50,6 +55,16 @@ class Settings:
     log_file: str = "logs/crewai.log"
     game_title: str = "Idle Adventure"
     game_version: str = "1.0.0"
+    # crewai prints every agent step and task result when verbose; turn it
+    # off for long unattended runs where that console output isn't read.
+    verbose: bool = True
+    # Crew memory embeds and searches past steps through the Gemini
+    # embeddings API on every agent step; disable it to drop those round
+    # trips when the tasks don't need recall across steps.
+    memory: bool = True
+    # Log to the console even when stdout isn't a terminal. Off by default
+    # because redirected stdout usually ends up next to the log file anyway.
+    force_console_log: bool = False
     project_root: Path = field(default_factory=Path.cwd)
     comm_file: Path = field(default_factory=lambda: Path("Game/shared/agent_communication.json"))
 
@@ -64,4 +79,7 @@ class Settings:
             log_file=_optional("LOG_FILE", "logs/crewai.log"),
             game_title=_optional("GAME_TITLE", "Idle Adventure"),
             game_version=_optional("GAME_VERSION", "1.0.0"),
+            verbose=_flag("CREW_VERBOSE", True),
+            memory=_flag("CREW_MEMORY", True),
+            force_console_log=_flag("FORCE_CONSOLE_LOG", False),
         )
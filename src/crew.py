@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
 from crewai import Crew, Process
+from crewai.memory import EntityMemory, ShortTermMemory
 
 from .agents import build_parallel_agents, build_sequential_agents
 from .config import Settings
 from .errors import Codes, CrewError
-from .llm import embedder_config, make_llm
+from .llm import embedder_config
 from .logging_setup import get_logger
 from .tasks import build_parallel_tasks, build_sequential_tasks
 
@@ -34,6 +36,81 @@ class CrewBundle:
             ) from exc
 
 
+@dataclass
+class ParallelCrewBundle:
+    """One single-task crew per agent, kicked off concurrently.
+
+    Replaces a hierarchical crew whose manager LLM serialized every worker
+    step; agents coordinate through the communication hub instead. A crew
+    that fails is retried on its own with exponential backoff while the
+    others keep running.
+    """
+
+    crews: list[Crew]
+    description: str
+    retries: int = 2
+    backoff_s: float = 5.0
+
+    def kickoff(self, inputs: dict[str, Any] | None = None) -> list[Any]:
+        try:
+            results = asyncio.run(self._kickoff_all(inputs or {}))
+        except Exception as exc:  # noqa: BLE001
+            raise CrewError(
+                "crew kickoff failed",
+                code=Codes.CREW_KICKOFF_FAILED,
+                cause=exc,
+                context={"mode": self.description},
+            ) from exc
+        failed = {
+            _crew_role(crew): result
+            for crew, result in zip(self.crews, results)
+            if isinstance(result, BaseException)
+        }
+        if failed:
+            first = next(iter(failed.values()))
+            raise CrewError(
+                f"{len(failed)} of {len(self.crews)} crews failed",
+                code=Codes.CREW_KICKOFF_FAILED,
+                cause=first,
+                context={"mode": self.description, "failed": sorted(failed)},
+            ) from first
+        return results
+
+    async def _kickoff_all(self, inputs: dict[str, Any]) -> list[Any]:
+        return list(
+            await asyncio.gather(
+                *(self._kickoff_one(crew, inputs) for crew in self.crews),
+                return_exceptions=True,
+            )
+        )
+
+    async def _kickoff_one(self, crew: Crew, inputs: dict[str, Any]) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await crew.kickoff_async(inputs=inputs)
+            except Exception as exc:  # noqa: BLE001
+                if attempt >= self.retries:
+                    raise
+                delay = self.backoff_s * 2**attempt
+                attempt += 1
+                logger.warning(
+                    "%s crew failed (attempt %d/%d), retrying in %.0fs: %s",
+                    _crew_role(crew), attempt, self.retries + 1, delay, exc,
+                )
+                await asyncio.sleep(delay)
+
+
+def _crew_role(crew: Crew) -> str:
+    return crew.agents[0].role if crew.agents else "?"
+
+
+def _memory_kwargs(settings: Settings) -> dict[str, Any]:
+    if not settings.memory:
+        return {"memory": False}
+    return {"memory": True, "embedder": embedder_config(settings)}
+
+
 def build_sequential_crew(settings: Settings) -> CrewBundle:
     try:
         agents = build_sequential_agents(settings)
@@ -42,9 +119,8 @@ def build_sequential_crew(settings: Settings) -> CrewBundle:
             agents=agents.as_list(),
             tasks=tasks.as_list(),
             process=Process.sequential,
-            verbose=True,
-            memory=True,
-            embedder=embedder_config(settings),
+            verbose=settings.verbose,
+            **_memory_kwargs(settings),
         )
         return CrewBundle(crew=crew, description="sequential")
     except CrewError:
@@ -57,22 +133,30 @@ def build_sequential_crew(settings: Settings) -> CrewBundle:
         ) from exc
 
 
-def build_parallel_crew(settings: Settings) -> CrewBundle:
+def build_parallel_crew(settings: Settings) -> ParallelCrewBundle:
     try:
         agents = build_parallel_agents(settings)
         tasks = build_parallel_tasks(agents)
-        crew = Crew(
-            agents=agents.as_list(),
-            tasks=tasks.as_list(),
-            process=Process.hierarchical,
-            manager_llm=make_llm(settings, temperature=0.4),
-            verbose=True,
-            memory=True,
-            embedder=embedder_config(settings),
-            max_rpm=4000,
-            share_crew=True,
-        )
-        return CrewBundle(crew=crew, description="parallel")
+        memory = _memory_kwargs(settings)
+        if settings.memory:
+            # One RAG store per memory kind for the whole run; left to
+            # themselves, each sub-crew would build and embed into its own.
+            embedder = memory["embedder"]
+            memory.update(
+                short_term_memory=ShortTermMemory(embedder_config=embedder),
+                entity_memory=EntityMemory(embedder_config=embedder),
+            )
+        crews = [
+            Crew(
+                agents=[task.agent],
+                tasks=[task],
+                process=Process.sequential,
+                verbose=settings.verbose,
+                **memory,
+            )
+            for task in tasks.as_list()
+        ]
+        return ParallelCrewBundle(crews=crews, description="parallel")
     except CrewError:
         raise
     except Exception as exc:  # noqa: BLE001
@@ -83,29 +167,36 @@ def build_parallel_crew(settings: Settings) -> CrewBundle:
         ) from exc
 
 
+# Static game spec. Tuples so nothing can edit the shared copy; inputs
+# get fresh lists because crewai renders them into the task prompts.
+TARGET_PLATFORMS = ("Windows", "macOS", "Linux")
+FEATURES = (
+    "Resource generation and management",
+    "Multi-tier upgrade systems",
+    "Achievement system with rewards",
+    "Save/load functionality",
+    "Automation features",
+    "Prestige/rebirth mechanics",
+    "Visual animations and effects",
+    "Statistics tracking",
+    "Settings and customization",
+)
+TECHNICAL_REQUIREMENTS = (
+    "Object-oriented architecture",
+    "Modular design patterns",
+    "Structured error handling and logging",
+    "Performance optimization",
+    "Cross-platform compatibility",
+    "Automated testing suite",
+)
+
+
 def default_inputs(settings: Settings) -> dict[str, Any]:
     return {
         "game_title": settings.game_title,
         "game_version": settings.game_version,
-        "target_platforms": ["Windows", "macOS", "Linux"],
+        "target_platforms": list(TARGET_PLATFORMS),
         "gui_framework": "tkinter",
-        "features": [
-            "Resource generation and management",
-            "Multi-tier upgrade systems",
-            "Achievement system with rewards",
-            "Save/load functionality",
-            "Automation features",
-            "Prestige/rebirth mechanics",
-            "Visual animations and effects",
-            "Statistics tracking",
-            "Settings and customization",
-        ],
-        "technical_requirements": [
-            "Object-oriented architecture",
-            "Modular design patterns",
-            "Structured error handling and logging",
-            "Performance optimization",
-            "Cross-platform compatibility",
-            "Automated testing suite",
-        ],
+        "features": list(FEATURES),
+        "technical_requirements": list(TECHNICAL_REQUIREMENTS),
     }
@@ -9,16 +9,26 @@ panels consume.
 from __future__ import annotations
 
 import os
+import select
 import signal
 import subprocess
 import sys
+import threading
+from collections import deque
 from pathlib import Path
+from typing import IO
 
 from ..errors import Codes, GUIError
 from ..logging_setup import get_logger
 
 logger = get_logger(__name__)
 
+OUTPUT_LINES = 500
+
+# Resolved once; the child is always launched with the dashboard's interpreter.
+PYEXE = sys.executable
+IS_WINDOWS = sys.platform == "win32"
+
 
 class AgentRunner:
     """Owns the lifecycle of the agent subprocess."""
@@ -27,28 +37,66 @@ class AgentRunner:
         self.mode = mode
         self.project_root = project_root or Path.cwd()
         self._process: subprocess.Popen[bytes] | None = None
+        # Tail of the current child's combined stdout/stderr; bounded so a
+        # chatty crew can't grow the dashboard's memory without limit. Each
+        # start gets a fresh deque.
+        self._output: deque[str] = deque(maxlen=OUTPUT_LINES)
+        # Lines captured so far; a restart bumps it past OUTPUT_LINES so
+        # views know to redraw rather than append.
+        self.output_version = 0
+        self._output_lock = threading.Lock()
 
+    # The dashboard polls these from the Tk thread while a worker thread may
+    # be swapping _process out, so read it into a local exactly once.
     @property
     def running(self) -> bool:
-        return self._process is not None and self._process.poll() is None
+        proc = self._process
+        return proc is not None and proc.poll() is None
 
     @property
     def pid(self) -> int | None:
-        return self._process.pid if self.running else None
+        proc = self._process
+        return proc.pid if proc is not None and proc.poll() is None else None
 
     def start(self) -> int:
         if self.running:
             return self._process.pid  # type: ignore[union-attr]
         try:
-            cmd = [sys.executable, "-m", "src.cli", "--mode", self.mode, "--no-menu"]
-            kwargs: dict = dict(cwd=str(self.project_root))
-            if sys.platform == "win32":
-                kwargs["creationflags"] = getattr(subprocess, "CREATE_NEW_CONSOLE", 0)
+            cmd = [PYEXE, "-m", "src.cli", "--mode", self.mode, "--no-menu"]
+            kwargs: dict = dict(
+                cwd=str(self.project_root),
+                # stdout is a pipe, not a TTY. Keep console logging on: the
+                # pipe feeds the Agent Output tab rather than a file, so the
+                # crew's log lines show there without a second disk write.
+                env={**os.environ, "FORCE_CONSOLE_LOG": "1", "PYTHONUNBUFFERED": "1"},
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+            if IS_WINDOWS:
+                # Output is captured and shown in the dashboard's Agent
+                # Output tab, so skip allocating a console window. The child
+                # runs unbuffered so crewai's prints reach the tab as they
+                # happen, as they did in the console.
+                kwargs["creationflags"] = getattr(subprocess, "CREATE_NO_WINDOW", 0) | getattr(
+                    subprocess, "CREATE_NEW_PROCESS_GROUP", 0
+                )
             else:
-                kwargs["stdout"] = subprocess.DEVNULL
-                kwargs["stderr"] = subprocess.DEVNULL
-                kwargs["preexec_fn"] = os.setsid
+                # Same as preexec_fn=os.setsid, but done in C by
+                # _posixsubprocess: no Python code runs in the forked child,
+                # which is slow and unsafe with the dashboard's threads.
+                kwargs["start_new_session"] = True
             self._process = subprocess.Popen(cmd, **kwargs)
+            if self._process.stdout is not None:
+                output: deque[str] = deque(maxlen=OUTPUT_LINES)
+                with self._output_lock:
+                    self._output = output
+                    self.output_version += OUTPUT_LINES
+                threading.Thread(
+                    target=self._drain,
+                    args=(self._process.stdout, output),
+                    name="agent-output",
+                    daemon=True,
+                ).start()
             logger.info("agent subprocess started pid=%s mode=%s", self._process.pid, self.mode)
             return self._process.pid
         except OSError as exc:
@@ -59,22 +107,39 @@ class AgentRunner:
                 context={"mode": self.mode},
             ) from exc
 
+    def recent_output(self) -> tuple[int, list[str]]:
+        """``(output_version, lines)``: the last ``OUTPUT_LINES`` lines the
+        agent process wrote, with the version they correspond to."""
+        with self._output_lock:
+            return self.output_version, list(self._output)
+
+    def _drain(self, stream: IO[bytes], output: deque[str]) -> None:
+        # Read line by line as the child writes so the pipe never fills up
+        # and stalls it; ends at EOF when the process exits. A previous
+        # run's workers can hold its pipe open past a restart, so lines
+        # only count while ``output`` is still the current run's.
+        with stream:
+            for raw in stream:
+                line = raw.decode("utf-8", errors="replace").rstrip()
+                with self._output_lock:
+                    if output is self._output:
+                        output.append(line)
+                        self.output_version += 1
+
     def stop(self, *, timeout: float = 5.0) -> None:
-        if not self.running:
-            return
         proc = self._process
-        assert proc is not None
+        if proc is None:
+            return
+        # Signal even if the leader has already exited: crew workers in its
+        # group may still be running.
         try:
-            if sys.platform == "win32":
-                proc.terminate()
-            else:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+            self._signal(proc, kill=False)
             try:
-                proc.wait(timeout=timeout)
+                _wait(proc, timeout)
             except subprocess.TimeoutExpired:
                 logger.warning("agent did not exit within %.1fs, killing", timeout)
-                proc.kill()
-                proc.wait(timeout=timeout)
+                self._signal(proc, kill=True)
+                _wait(proc, timeout)
         except OSError as exc:
             raise GUIError(
                 "failed to stop agent subprocess",
@@ -84,3 +149,47 @@ class AgentRunner:
             ) from exc
         finally:
             self._process = None
+
+    @staticmethod
+    def _signal(proc: subprocess.Popen[bytes], *, kill: bool) -> None:
+        """Signal the whole process group the crew runs in.
+
+        The child leads its own session (start_new_session), so its pid is
+        the group id; getpgid would fail once the leader has exited while
+        its workers linger. Windows has no groups here, so only the child
+        is signalled.
+        """
+        if IS_WINDOWS:
+            if proc.poll() is not None:
+                return
+            if kill:
+                proc.kill()
+            else:
+                proc.terminate()
+            return
+        try:
+            os.killpg(proc.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # every process in the group has already exited
+
+
+def _wait(proc: subprocess.Popen[bytes], timeout: float) -> int:
+    """``proc.wait(timeout)`` that sleeps on a pidfd where the OS has one.
+
+    Popen.wait with a timeout polls waitpid on a backoff loop; a pidfd
+    (Linux 5.3+) becomes readable the moment the child exits.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None or proc.poll() is not None:
+        return proc.wait(timeout=timeout)
+    try:
+        fd = pidfd_open(proc.pid)
+    except OSError:  # older kernel, or the child was reaped meanwhile
+        return proc.wait(timeout=timeout)
+    try:
+        ready, _, _ = select.select([fd], [], [], timeout)
+    finally:
+        os.close(fd)
+    if not ready:
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    return proc.wait()
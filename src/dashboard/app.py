@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import queue
 import threading
+import time
 import tkinter as tk
 from datetime import datetime
 from tkinter import messagebox, ttk
@@ -12,7 +14,9 @@ from ..errors import Codes, CrewAIError, GUIError
 from ..logging_setup import get_logger
 from .agent_runner import AgentRunner
 from .panels import (
+    AgentOutputPanel,
     AgentStatusPanel,
+    BasePanel,
     CommunicationsPanel,
     ConflictsPanel,
     FileLocksPanel,
@@ -24,6 +28,43 @@ from .theme import Palette, apply_theme
 logger = get_logger(__name__)
 
 REFRESH_MS = 1500
+FLUSH_MS = 50
+MIN_REFRESH_MS = 250
+MAX_REFRESH_MS = 6000
+# How long closing the window waits for the runner to stop the crew. The
+# stop has already signalled the crew by then; only its grace period and
+# the escalation to a kill are cut short.
+CLOSE_WAIT_S = 2.0
+
+
+class RefreshPacer:
+    """Pick the next refresh interval from the measured cost of redraws.
+
+    Keeps an exponential moving average of redraw time. While redraws are
+    cheap the tick runs at ``target_ms`` minus the work just done, so the
+    period stays steady; once a redraw would eat more than 1/``load_factor``
+    of the interval, the tick backs off so the UI thread never starves.
+    """
+
+    def __init__(
+        self,
+        target_ms: int = REFRESH_MS,
+        *,
+        alpha: float = 0.2,
+        load_factor: int = 4,
+    ) -> None:
+        self.target_ms = target_ms
+        self.alpha = alpha
+        self.load_factor = load_factor
+        self.cost_ms = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        self.cost_ms += self.alpha * (elapsed_ms - self.cost_ms)
+
+    def next_interval_ms(self) -> int:
+        if self.cost_ms * self.load_factor > self.target_ms:
+            return min(MAX_REFRESH_MS, int(self.cost_ms * self.load_factor))
+        return max(MIN_REFRESH_MS, int(self.target_ms - self.cost_ms))
 
 
 class DashboardApp:
@@ -47,9 +88,18 @@ class DashboardApp:
         self.hub = hub or CommunicationHub()
         self.runner = AgentRunner(mode=mode)
         self._stop_event = threading.Event()
+        self._dirty: set[BasePanel] = set()
+        self._flush_id: str | None = None
+        self._pacer = RefreshPacer()
+        self._runner_cmds: queue.Queue[str | None] = queue.Queue()
+        self._notice: str | None = None
+        # Status bar text while a start/stop request is in flight.
+        self._pending_status: str | None = None
+        self._runner_failure: tuple[str, GUIError] | None = None
 
         self._build_ui()
         self._start_polling_thread()
+        self._start_runner_thread()
         self.root.after(REFRESH_MS, self._refresh_ui)
 
     # ---------- UI construction ----------
@@ -81,18 +131,31 @@ class DashboardApp:
 
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill="both", expand=True, padx=12, pady=(8, 8))
+        self.notebook = notebook
 
         self.agent_panel = AgentStatusPanel(notebook)
         self.comm_panel = CommunicationsPanel(notebook)
         self.locks_panel = FileLocksPanel(notebook)
         self.integration_panel = IntegrationPanel(notebook)
         self.conflicts_panel = ConflictsPanel(notebook)
+        self.output_panel = AgentOutputPanel(notebook)
 
         notebook.add(self.agent_panel, text="Agents")
         notebook.add(self.comm_panel, text="Messages")
         notebook.add(self.locks_panel, text="File Locks")
         notebook.add(self.integration_panel, text="Integration")
         notebook.add(self.conflicts_panel, text="Conflicts")
+        notebook.add(self.output_panel, text="Agent Output")
+
+        self._panels: list[BasePanel] = [
+            self.agent_panel,
+            self.comm_panel,
+            self.locks_panel,
+            self.integration_panel,
+            self.conflicts_panel,
+            self.output_panel,
+        ]
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.status_bar = ttk.Label(self.root, text="Idle", style="Status.TLabel")
         self.status_bar.pack(side="bottom", fill="x", padx=12, pady=(0, 8))
@@ -103,15 +166,21 @@ class DashboardApp:
         thread.start()
 
     def _poll_loop(self) -> None:
+        seen_state: DashboardState | None = None
+        seen_snapshot: dict | None = None
         while not self._stop_event.is_set():
             try:
-                snapshot = self.hub.snapshot()
-                self.state.status_updates = snapshot.get("status_updates", [])
-                self.state.communications = snapshot.get("communications", [])
-                self.state.file_locks = snapshot.get("file_locks", {})
-                self.state.integration_points = snapshot.get("integration_points", [])
-                self.state.conflict_reports = snapshot.get("conflict_reports", [])
-                self.state.shared_context = snapshot.get("shared_context", {})
+                # The hub hands back the same dict while the file is
+                # unchanged; skip ingesting it twice into the same state.
+                state, snapshot = self.state, self.hub.snapshot()
+                if state is not seen_state or snapshot is not seen_snapshot:
+                    state.ingest_status_updates(snapshot.get("status_updates", []))
+                    state.ingest_communications(snapshot.get("communications", []))
+                    state.ingest_file_locks(snapshot.get("file_locks", {}))
+                    state.ingest_integration_points(snapshot.get("integration_points", []))
+                    state.ingest_conflict_reports(snapshot.get("conflict_reports", []))
+                    state.shared_context = snapshot.get("shared_context", {})
+                    seen_state, seen_snapshot = state, snapshot
             except CrewAIError as exc:
                 self.state.last_error_code = exc.code.code
                 self.state.last_error_message = str(exc)
@@ -122,13 +191,68 @@ class DashboardApp:
                 logger.exception("unexpected poll failure")
             self._stop_event.wait(REFRESH_MS / 1000)
 
+    # ---------- agent process worker ----------
+    def _start_runner_thread(self) -> None:
+        self._runner_thread = threading.Thread(
+            target=self._runner_loop, name="agent-runner", daemon=True
+        )
+        self._runner_thread.start()
+
+    def _runner_loop(self) -> None:
+        """Run start/stop requests off the Tk thread.
+
+        Stopping can wait several seconds for the crew to exit; doing it
+        here keeps the UI responsive. Requests queued while one is running
+        collapse to the most recent, so rapid clicks don't thrash. ``None``
+        ends the loop once the last request before it has run.
+        """
+        while True:
+            cmd = self._runner_cmds.get()
+            shutdown = cmd is None
+            try:
+                while True:
+                    queued = self._runner_cmds.get_nowait()
+                    if queued is None:
+                        shutdown = True
+                    else:
+                        cmd = queued
+            except queue.Empty:
+                pass
+            if cmd is not None:
+                try:
+                    if cmd == "start":
+                        pid = self.runner.start()
+                        self._notice = f"Agent process started (pid={pid})"
+                    else:
+                        self.runner.stop()
+                        self._notice = "Agent process stopped"
+                except GUIError as exc:
+                    self._runner_failure = (f"Failed to {cmd}", exc)
+                except Exception as exc:  # noqa: BLE001 - the worker must outlive a bad request
+                    logger.exception("agent runner failed to %s", cmd)
+                    self._runner_failure = (
+                        f"Failed to {cmd}",
+                        GUIError(str(exc), code=Codes.GUI_PROCESS_FAILED, cause=exc),
+                    )
+            if shutdown:
+                return
+
     # ---------- refresh ----------
     def _refresh_ui(self) -> None:
         try:
+            failure, self._runner_failure = self._runner_failure, None
+            if failure is not None:
+                self._pending_status = None
+                title, exc = failure
+                messagebox.showerror(f"[{exc.code.code}] {title}", str(exc))
+            # Snapshot the clock and process state once per tick: each
+            # runner.running is a poll() syscall on the child.
+            now = datetime.now()
+            running = self.runner.running
             self.session_label.config(
-                text=f"Session: {self.state.session_start.strftime('%Y-%m-%d %H:%M:%S')}    "
-                     f"Uptime: {self.state.session_duration()}    "
-                     f"Agents: {'running' if self.runner.running else 'stopped'}"
+                text=f"Session: {self.state.session_start_text}    "
+                     f"Uptime: {self.state.session_duration(now)}    "
+                     f"Agents: {'running' if running else 'stopped'}"
             )
             if self.state.last_error_code:
                 self.error_label.config(
@@ -138,52 +262,91 @@ class DashboardApp:
             else:
                 self.error_label.config(text="", foreground=Palette.MUTED)
 
-            self.state.agents_running = self.runner.running
-            self.state.agent_pid = self.runner.pid
-            self.start_btn.state(["disabled"] if self.runner.running else ["!disabled"])
-            self.stop_btn.state(["!disabled"] if self.runner.running else ["disabled"])
-
-            self.agent_panel.refresh(self.state)
-            self.comm_panel.refresh(self.state)
-            self.locks_panel.refresh(self.state)
-            self.integration_panel.refresh(self.state)
-            self.conflicts_panel.refresh(self.state)
+            self.state.agents_running = running
+            self.state.agent_pid = self.runner.pid if running else None
+            self.start_btn.state(["disabled"] if running else ["!disabled"])
+            self.stop_btn.state(["!disabled"] if running else ["disabled"])
+            if self.runner.output_version != self.state.output_version:
+                self.state.output_version, lines = self.runner.recent_output()
+                self.state.agent_output = tuple(lines)
 
+            self._mark_dirty()
+        except Exception as exc:  # noqa: BLE001 - never let refresh kill the loop
+            logger.exception("refresh failed")
+            self.status_bar.config(
+                text=f"[{Codes.GUI_UPDATE_FAILED.code}] refresh failed: {exc}"
+            )
+        finally:
+            self.root.after(self._pacer.next_interval_ms(), self._refresh_ui)
+
+    def _mark_dirty(self, *panels: BasePanel) -> None:
+        """Queue panels for redraw; bursts within FLUSH_MS collapse into one."""
+        self._dirty.update(panels or self._panels)
+        if self._flush_id is None:
+            self._flush_id = self.root.after(FLUSH_MS, self._flush_dirty)
+
+    def _flush_dirty(self) -> None:
+        self._flush_id = None
+        # Only the selected tab is drawn; hidden panels stay dirty until
+        # their tab is shown.
+        visible = self.notebook.select()
+        dirty = {p for p in self._dirty if str(p) == visible}
+        self._dirty -= dirty
+        started = time.perf_counter()
+        try:
+            for panel in dirty:
+                panel.refresh(self.state)
+            self._pacer.record((time.perf_counter() - started) * 1000)
+            notice, self._notice = self._notice, None
+            if notice is not None:
+                self._pending_status = None
             self.status_bar.config(
-                text=f"OK | last refresh {datetime.now().strftime('%H:%M:%S')}"
+                text=notice
+                or self._pending_status
+                or f"OK | last refresh {datetime.now().strftime('%H:%M:%S')}"
             )
         except Exception as exc:  # noqa: BLE001 - never let refresh kill the loop
             logger.exception("refresh failed")
             self.status_bar.config(
                 text=f"[{Codes.GUI_UPDATE_FAILED.code}] refresh failed: {exc}"
             )
-        finally:
-            self.root.after(REFRESH_MS, self._refresh_ui)
+
+    def _on_tab_changed(self, _event: tk.Event) -> None:
+        self._mark_dirty(self.root.nametowidget(self.notebook.select()))
 
     # ---------- button handlers ----------
     def _on_start(self) -> None:
-        try:
-            pid = self.runner.start()
-            self.status_bar.config(text=f"Agent process started (pid={pid})")
-        except GUIError as exc:
-            messagebox.showerror(f"[{exc.code.code}] Failed to start", str(exc))
+        self._request_runner("start", "Starting agents...")
 
     def _on_stop(self) -> None:
-        try:
-            self.runner.stop()
-            self.status_bar.config(text="Agent process stopped")
-        except GUIError as exc:
-            messagebox.showerror(f"[{exc.code.code}] Failed to stop", str(exc))
+        self._request_runner("stop", "Stopping agents...")
+
+    def _request_runner(self, cmd: str, status: str) -> None:
+        # Set before queueing so the worker's notice always clears it.
+        self._pending_status = status
+        self.status_bar.config(text=status)
+        self._runner_cmds.put(cmd)
 
     def _on_reset(self) -> None:
         self.state = DashboardState()
+        self._mark_dirty()
 
     def _on_close(self) -> None:
         self._stop_event.set()
-        try:
-            self.runner.stop()
-        except GUIError as exc:
-            logger.warning("error stopping agents on close: %s", exc)
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            self._flush_id = None
+        # Stop through the worker: a start still in flight there would
+        # otherwise finish after a direct stop() and leave an orphaned crew.
+        self._runner_cmds.put("stop")
+        self._runner_cmds.put(None)
+        self.root.withdraw()
+        self._runner_thread.join(CLOSE_WAIT_S)
+        if self._runner_thread.is_alive():
+            logger.warning("agents still stopping after %.0fs; closing anyway", CLOSE_WAIT_S)
+        failure, self._runner_failure = self._runner_failure, None
+        if failure is not None:
+            logger.warning("error stopping agents on close: %s", failure[1])
         self.root.destroy()
 
     def run(self) -> None:
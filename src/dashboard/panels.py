@@ -4,17 +4,32 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Iterable
+from typing import Callable, TypeVar
 
-from .state import DashboardState
+from .agent_runner import OUTPUT_LINES
+from .state import CommRow, DashboardState, TailWindow
 from .theme import Palette
 
 
+T = TypeVar("T")
+
+MSG_COLORS = {
+    "info": Palette.ACCENT,
+    "conflict": Palette.DANGER,
+    "code_review_request": Palette.WARN,
+}
+# Tag for message types missing from MSG_COLORS; the accent colour, as
+# every other type was drawn before the table existed.
+DEFAULT_MSG_TAG = "_default"
+
+
 class BasePanel(ttk.Frame):
     title: str = ""
 
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent, style="TFrame")
+        self._seen_state: DashboardState | None = None
+        self._seen_version = 0
         if self.title:
             ttk.Label(self, text=self.title, style="Header.TLabel").pack(
                 anchor="w", padx=8, pady=(8, 4), fill="x"
@@ -23,6 +38,63 @@ class BasePanel(ttk.Frame):
     def refresh(self, state: DashboardState) -> None:  # pragma: no cover - overridden
         raise NotImplementedError
 
+    def _append_tail(
+        self,
+        state: DashboardState,
+        window: TailWindow[T],
+        insert: Callable[[T], str],
+    ) -> str | None:
+        """Sync ``self.tree`` with ``window`` by inserting only new rows.
+
+        Falls back to a full redraw when the state was replaced or more rows
+        changed than fit in the window. Returns the iid of the last row
+        inserted, if any.
+        """
+        version, items = window.view
+        delta = self._unseen(state, version)
+        if delta == 0:
+            return None
+        if delta is None or delta >= len(items):
+            self.tree.delete(*self.tree.get_children())
+            fresh = items
+        else:
+            fresh = items[len(items) - delta:]
+        last = None
+        try:
+            for item in fresh:
+                last = insert(item)
+            children = self.tree.get_children()
+            if len(children) > window.size:
+                self.tree.delete(*children[: len(children) - window.size])
+        except BaseException:
+            self._redraw_next()
+            raise
+        self._mark_seen(state, version)
+        return last
+
+    def _unseen(self, state: DashboardState, version: int) -> int | None:
+        """How many versions are new since the last render.
+
+        ``None`` if the state object itself was replaced, 0 if nothing
+        changed.
+        """
+        if state is not self._seen_state:
+            return None
+        return version - self._seen_version
+
+    def _mark_seen(self, state: DashboardState, version: int) -> None:
+        """Record ``version`` as rendered, once the redraw has gone through.
+
+        A redraw that raises leaves the old version in place and is retried
+        on the next refresh instead of the panel staying stale.
+        """
+        self._seen_state = state
+        self._seen_version = version
+
+    def _redraw_next(self) -> None:
+        """Make the next refresh a full redraw, after a partial one."""
+        self._seen_state = None
+
 
 class AgentStatusPanel(BasePanel):
     title = "Agent Status"
@@ -41,50 +113,61 @@ class AgentStatusPanel(BasePanel):
         self.tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
     def refresh(self, state: DashboardState) -> None:
-        self.tree.delete(*self.tree.get_children())
-        for agent, update in sorted(state.latest_status_per_agent().items()):
-            self.tree.insert(
-                "",
-                "end",
-                values=(agent, update.get("status", "?"), update.get("timestamp", "")[:19]),
-            )
+        if self._unseen(state, state.status_version) == 0:
+            return
+        # Rows are keyed by agent name and updated in place; rows are only
+        # created or dropped when the set of agents changes.
+        latest = state.latest_status_per_agent()
+        stale = [iid for iid in self.tree.get_children() if iid not in latest]
+        if stale:
+            self.tree.delete(*stale)
+        for index, (agent, update) in enumerate(sorted(latest.items())):
+            values = (agent, update.get("status", "?"), (update.get("timestamp", "") or "")[:19])
+            if self.tree.exists(agent):
+                self.tree.item(agent, values=values)
+                self.tree.move(agent, "", index)
+            else:
+                self.tree.insert("", index, iid=agent, values=values)
+        self._mark_seen(state, state.status_version)
 
 
 class CommunicationsPanel(BasePanel):
     title = "Recent Communications"
 
+    columns = ("time", "from", "to", "message", "type")
+
     def __init__(self, parent: tk.Misc) -> None:
         super().__init__(parent)
-        self.text = tk.Text(
-            self,
-            background=Palette.SURFACE,
-            foreground=Palette.TEXT,
-            insertbackground=Palette.TEXT,
-            relief="flat",
-            borderwidth=0,
-            wrap="word",
-            font=("Consolas", 9),
-            height=12,
-        )
-        self.text.pack(fill="both", expand=True, padx=8, pady=(0, 8))
-        self.text.tag_config("from", foreground=Palette.ACCENT, font=("Consolas", 9, "bold"))
-        self.text.tag_config("warn", foreground=Palette.WARN)
-        self.text.tag_config("err", foreground=Palette.DANGER)
-        self.text.config(state="disabled")
+        self.tree = ttk.Treeview(self, columns=self.columns, show="headings", height=12)
+        self.tree.heading("time", text="Time")
+        self.tree.heading("from", text="From")
+        self.tree.heading("to", text="To")
+        self.tree.heading("message", text="Message")
+        self.tree.heading("type", text="Type")
+        self.tree.column("time", width=140, stretch=False)
+        self.tree.column("from", width=140, stretch=False)
+        self.tree.column("to", width=140, stretch=False)
+        self.tree.column("message", width=520)
+        self.tree.column("type", width=140, stretch=False)
+        self.tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        for kind, color in MSG_COLORS.items():
+            self.tree.tag_configure(kind, foreground=color)
+        self.tree.tag_configure(DEFAULT_MSG_TAG, foreground=Palette.ACCENT)
 
     def refresh(self, state: DashboardState) -> None:
-        self.text.config(state="normal")
-        self.text.delete("1.0", "end")
-        for entry in state.communications[-50:]:
-            ts = (entry.get("timestamp", "") or "")[:19]
-            sender = entry.get("from_agent", "?")
-            recipient = entry.get("to_agent", "?")
-            kind = entry.get("type", "info")
-            tag = "err" if kind == "conflict" else "warn" if kind == "code_review_request" else "from"
-            self.text.insert("end", f"[{ts}] {sender} -> {recipient}: ", tag)
-            self.text.insert("end", f"{entry.get('message', '')}\n")
-        self.text.config(state="disabled")
-        self.text.see("end")
+        last = self._append_tail(state, state.comm_window, self._insert)
+        if last is not None:
+            self.tree.see(last)
+
+    def _insert(self, row: CommRow) -> str:
+        iid, kind, values = row
+        if self.tree.exists(iid):
+            # Two hub entries sharing an id; show both rather than fail.
+            iid = None
+        # Rows are tagged with their message type; types without an entry
+        # in MSG_COLORS share the default tag.
+        tag = kind if kind in MSG_COLORS else DEFAULT_MSG_TAG
+        return self.tree.insert("", "end", iid=iid, values=values, tags=(tag,))
 
 
 class FileLocksPanel(BasePanel):
@@ -104,6 +187,8 @@ class FileLocksPanel(BasePanel):
         self.tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
     def refresh(self, state: DashboardState) -> None:
+        if self._unseen(state, state.locks_version) == 0:
+            return
         self.tree.delete(*self.tree.get_children())
         for path, info in state.file_locks.items():
             self.tree.insert(
@@ -111,6 +196,7 @@ class FileLocksPanel(BasePanel):
                 "end",
                 values=(path, info.get("agent", "?"), (info.get("timestamp", "") or "")[:19]),
             )
+        self._mark_seen(state, state.locks_version)
 
 
 class IntegrationPanel(BasePanel):
@@ -130,15 +216,10 @@ class IntegrationPanel(BasePanel):
         self.tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
     def refresh(self, state: DashboardState) -> None:
-        self.tree.delete(*self.tree.get_children())
-        for point in state.integration_points[-30:]:
-            interface = point.get("interface") or {}
-            deps: Iterable[str] = interface.get("dependencies", []) or []
-            self.tree.insert(
-                "",
-                "end",
-                values=(point.get("component", "?"), point.get("agent", "?"), ", ".join(deps)),
-            )
+        self._append_tail(state, state.integration_window, self._insert)
+
+    def _insert(self, values: tuple[str, ...]) -> str:
+        return self.tree.insert("", "end", values=values)
 
 
 class ConflictsPanel(BasePanel):
@@ -158,14 +239,61 @@ class ConflictsPanel(BasePanel):
         self.tree.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
     def refresh(self, state: DashboardState) -> None:
-        self.tree.delete(*self.tree.get_children())
-        for entry in state.conflict_reports[-30:]:
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    (entry.get("timestamp", "") or "")[:19],
-                    entry.get("agent", "?"),
-                    entry.get("description", ""),
-                ),
-            )
+        self._append_tail(state, state.conflict_window, self._insert)
+
+    def _insert(self, values: tuple[str, ...]) -> str:
+        return self.tree.insert("", "end", values=values)
+
+
+class AgentOutputPanel(BasePanel):
+    title = "Agent Output"
+
+    def __init__(self, parent: tk.Misc) -> None:
+        super().__init__(parent)
+        body = ttk.Frame(self, style="TFrame")
+        body.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        self.text = tk.Text(
+            body,
+            wrap="none",
+            height=20,
+            background=Palette.SURFACE,
+            foreground=Palette.TEXT,
+            insertbackground=Palette.TEXT,
+            borderwidth=0,
+            font=("Consolas", 9),
+            state="disabled",
+        )
+        scroll = ttk.Scrollbar(body, orient="vertical", command=self.text.yview)
+        self.text.configure(yscrollcommand=scroll.set)
+        scroll.pack(side="right", fill="y")
+        self.text.pack(side="left", fill="both", expand=True)
+
+    def refresh(self, state: DashboardState) -> None:
+        lines = state.agent_output
+        delta = self._unseen(state, state.output_version)
+        if delta == 0:
+            return
+        self.text.configure(state="normal")
+        try:
+            self._append_lines(lines, delta)
+        except BaseException:
+            self._redraw_next()
+            raise
+        finally:
+            self.text.configure(state="disabled")
+        self._mark_seen(state, state.output_version)
+        self.text.see("end")
+
+    def _append_lines(self, lines: tuple[str, ...], delta: int | None) -> None:
+        if delta is None or delta >= len(lines):
+            self.text.delete("1.0", "end")
+            fresh = lines
+        else:
+            fresh = lines[len(lines) - delta:]
+        if fresh:
+            self.text.insert("end", "\n".join(fresh) + "\n")
+        # Keep the widget to the runner's window; Text counts the trailing
+        # newline as an extra empty line.
+        excess = int(self.text.index("end-1c").split(".")[0]) - 1 - OUTPUT_LINES
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
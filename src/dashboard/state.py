@@ -2,9 +2,114 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from functools import cached_property
+from typing import Any, Callable, Generic, TypeVar
+
+COMM_WINDOW = 50
+INTEGRATION_WINDOW = 30
+CONFLICT_WINDOW = 30
+
+T = TypeVar("T")
+
+_UNSET = object()
+
+# (iid, kind, column values) — pre-rendered once at ingest so refresh only inserts.
+CommRow = tuple[str | None, str, tuple[str, ...]]
+
+
+def format_comm_row(entry: dict[str, Any]) -> CommRow:
+    return (
+        entry.get("id") or None,
+        entry.get("type", "info"),
+        (
+            (entry.get("timestamp", "") or "")[:19],
+            entry.get("from_agent", "?"),
+            entry.get("to_agent", "?"),
+            entry.get("message", ""),
+            entry.get("type", "info"),
+        ),
+    )
+
+
+def format_integration_row(point: dict[str, Any]) -> tuple[str, ...]:
+    interface = point.get("interface") or {}
+    deps = interface.get("dependencies", []) or []
+    return (point.get("component", "?"), point.get("agent", "?"), ", ".join(deps))
+
+
+def format_conflict_row(entry: dict[str, Any]) -> tuple[str, ...]:
+    return (
+        (entry.get("timestamp", "") or "")[:19],
+        entry.get("agent", "?"),
+        entry.get("description", ""),
+    )
+
+
+def _integration_key(point: dict[str, Any]) -> tuple[Any, ...]:
+    return (point.get("timestamp"), point.get("agent"), point.get("component"))
+
+
+def _conflict_key(entry: dict[str, Any]) -> tuple[Any, ...]:
+    return (entry.get("timestamp"), entry.get("agent"), entry.get("description"))
+
+
+def _status_key(update: dict[str, Any]) -> tuple[Any, ...]:
+    return (update.get("timestamp"), update.get("agent"), update.get("status"))
+
+
+def _tail_start(
+    entries: list[dict[str, Any]], last_key: Any, key: Callable[[dict[str, Any]], Any]
+) -> int | None:
+    """Index just past the last-seen entry, or None if it was trimmed away."""
+    if last_key is _UNSET:
+        return 0
+    for i in range(len(entries) - 1, -1, -1):
+        if key(entries[i]) == last_key:
+            return i + 1
+    return None
+
+
+class TailWindow(Generic[T]):
+    """Bounded ring buffer over the tail of a hub list.
+
+    The hub only appends to its lists and trims them from the front, so each
+    poll only has to render entries after the last one it saw. ``view`` is
+    published as a single ``(version, items)`` tuple so the Tk thread never
+    sees a version that doesn't match the items. The version grows by the
+    number of new items; a rebuild bumps it past the window size, which
+    tells the panel to redraw from scratch.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        key: Callable[[dict[str, Any]], Any],
+        render: Callable[[dict[str, Any]], T],
+    ) -> None:
+        self.size = size
+        self._key = key
+        self._render = render
+        self._items: deque[T] = deque(maxlen=size)
+        self._last_key: Any = _UNSET
+        self.view: tuple[int, tuple[T, ...]] = (0, ())
+
+    def ingest(self, entries: list[dict[str, Any]]) -> None:
+        start = _tail_start(entries, self._last_key, self._key)
+        cleared = start is None
+        if start is None:
+            # Last-seen entry was trimmed away; rebuild the window.
+            self._items.clear()
+            start = 0
+        fresh = entries[max(start, len(entries) - self.size):]
+        for entry in fresh:
+            self._items.append(self._render(entry))
+        self._last_key = self._key(entries[-1]) if entries else _UNSET
+        if fresh or cleared:
+            version = self.view[0] + len(fresh) + (self.size if cleared else 0)
+            self.view = (version, tuple(self._items))
 
 
 @dataclass
@@ -23,17 +128,73 @@ class DashboardState:
     conflict_reports: list[dict[str, Any]] = field(default_factory=list)
     shared_context: dict[str, Any] = field(default_factory=dict)
 
+    # Derived on the poll thread so panels can skip Tk work on idle ticks.
+    comm_window: TailWindow[CommRow] = field(
+        default_factory=lambda: TailWindow(COMM_WINDOW, lambda e: e.get("id"), format_comm_row)
+    )
+    integration_window: TailWindow[tuple[str, ...]] = field(
+        default_factory=lambda: TailWindow(
+            INTEGRATION_WINDOW, _integration_key, format_integration_row
+        )
+    )
+    conflict_window: TailWindow[tuple[str, ...]] = field(
+        default_factory=lambda: TailWindow(CONFLICT_WINDOW, _conflict_key, format_conflict_row)
+    )
+    locks_version: int = 0
+    # Tail of the agent subprocess's console output, copied from the runner
+    # on the Tk thread; output_version is the runner's line counter.
+    agent_output: tuple[str, ...] = ()
+    output_version: int = 0
+    latest_status: dict[str, dict[str, Any]] = field(default_factory=dict)
+    status_version: int = 0
+    _last_status_key: Any = field(default=_UNSET, repr=False)
+
+    def ingest_status_updates(self, updates: list[dict[str, Any]]) -> None:
+        """Fold only new updates into the per-agent index."""
+        start = _tail_start(updates, self._last_status_key, _status_key)
+        latest = self.latest_status
+        if start is None:
+            latest, start = {}, 0
+        fresh = updates[start:]
+        if fresh or latest is not self.latest_status:
+            # Copy-on-write so the Tk thread can iterate the published dict.
+            latest = dict(latest)
+            for u in fresh:
+                agent = u.get("agent")
+                if agent:
+                    latest[agent] = u
+            self.latest_status = latest
+            self.status_version += 1
+        self._last_status_key = _status_key(updates[-1]) if updates else _UNSET
+        self.status_updates = updates
+
+    def ingest_communications(self, entries: list[dict[str, Any]]) -> None:
+        self.comm_window.ingest(entries)
+        self.communications = entries
+
+    def ingest_file_locks(self, locks: dict[str, dict[str, Any]]) -> None:
+        if locks != self.file_locks:
+            self.file_locks = locks
+            self.locks_version += 1
+
+    def ingest_integration_points(self, points: list[dict[str, Any]]) -> None:
+        self.integration_window.ingest(points)
+        self.integration_points = points
+
+    def ingest_conflict_reports(self, reports: list[dict[str, Any]]) -> None:
+        self.conflict_window.ingest(reports)
+        self.conflict_reports = reports
+
     def latest_status_per_agent(self) -> dict[str, dict[str, Any]]:
-        latest: dict[str, dict[str, Any]] = {}
-        for u in self.status_updates:
-            agent = u.get("agent")
-            if not agent:
-                continue
-            latest[agent] = u
-        return latest
-
-    def session_duration(self) -> str:
-        delta = datetime.now() - self.session_start
+        return self.latest_status
+
+    @cached_property
+    def session_start_text(self) -> str:
+        # session_start never changes; format it once, not on every refresh.
+        return self.session_start.strftime("%Y-%m-%d %H:%M:%S")
+
+    def session_duration(self, now: datetime | None = None) -> str:
+        delta = (now or datetime.now()) - self.session_start
         seconds = int(delta.total_seconds())
         hours, rem = divmod(seconds, 3600)
         minutes, secs = divmod(rem, 60)
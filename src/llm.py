@@ -22,13 +22,23 @@ from .config import Settings
 from .errors import Codes, LLMError
 
 
-def make_llm(settings: Settings, *, temperature: float = 0.5, max_tokens: int = 8192) -> LLM:
+def make_llm(
+    settings: Settings,
+    *,
+    temperature: float = 0.5,
+    max_tokens: int = 8192,
+    num_retries: int = 3,
+) -> LLM:
     try:
+        # num_retries is forwarded to litellm, which retries rate-limit and
+        # transient errors with exponential backoff instead of failing the
+        # agent step.
         return LLM(
             model=settings.model,
             api_key=settings.gemini_api_key,
             temperature=temperature,
             max_tokens=max_tokens,
+            num_retries=num_retries,
         )
     except Exception as exc:  # noqa: BLE001 - wrap third-party
         raise LLMError(
@@ -60,14 +70,20 @@ def _docs_tool_config(settings: Settings, temperature: float) -> dict:
     )
 
 
+@lru_cache(maxsize=1)
+def _stateless_tools() -> tuple:
+    # These tools take no per-agent config, so every agent can share one
+    # instance. Built on first use rather than once per agent; the
+    # DirectorySearchTool in particular sets up its own RAG store.
+    return (FileReadTool(), FileWriterTool(), DirectorySearchTool())
+
+
 def make_default_tools(settings: Settings, *, temperature: float = 0.5):
     """Return the default toolset shared by most agents."""
     try:
         return [
             CodeDocsSearchTool(config=_docs_tool_config(settings, temperature)),
-            FileReadTool(),
-            FileWriterTool(),
-            DirectorySearchTool(),
+            *_stateless_tools(),
         ]
     except Exception as exc:  # noqa: BLE001
         raise LLMError(
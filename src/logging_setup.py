@@ -9,16 +9,31 @@ stdout/stderr to UTF-8.
 
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import stat
 import sys
+import threading
 from pathlib import Path
 
 from .errors import Codes, ConfigError
 
 VALID_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
 
+FILE_BUFFER = 512
+FILE_FLUSH_S = 30.0
+FILE_IO_BUFFER = 1 << 16
+_ROTATION = dict(maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8")
+# Text-mode files write each "\n" as os.linesep.
+_NEWLINE_EXTRA = len(os.linesep) - 1
+
+# Console and file writes happen on this listener's thread; loggers only
+# enqueue records. Replaced on every setup_logging call.
+_listener: logging.handlers.QueueListener | None = None
+
 
 def _coerce_level(level: str | int) -> int:
     if isinstance(level, int):
@@ -50,11 +65,17 @@ def setup_logging(
     *,
     fmt: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     datefmt: str = "%Y-%m-%d %H:%M:%S",
+    console: bool = True,
 ) -> logging.Logger:
-    """Configure root logger. Idempotent — safe to call multiple times."""
+    """Configure root logger. Idempotent — safe to call multiple times.
+
+    With ``console=False`` records only go to ``log_file`` (if there is one).
+    """
+    global _listener
     _ensure_utf8_streams()
     numeric_level = _coerce_level(level)
 
+    _stop_listener()
     root = logging.getLogger()
     for handler in list(root.handlers):
         root.removeHandler(handler)
@@ -63,30 +84,193 @@ def setup_logging(
         except Exception:
             pass
 
+    _skip_unused_record_fields(fmt)
     formatter = logging.Formatter(fmt, datefmt=datefmt)
 
     handlers: list[logging.Handler] = []
 
-    console = logging.StreamHandler(sys.stdout)
-    console.setFormatter(formatter)
-    handlers.append(console)
+    if console or not log_file:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
 
     if log_file:
-        path = Path(log_file)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.handlers.RotatingFileHandler(
-            path, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
-        )
+        file_handler = _open_log_file(Path(log_file))
         file_handler.setFormatter(formatter)
-        handlers.append(file_handler)
+        # Batch file writes: flush every FILE_BUFFER records, every
+        # FILE_FLUSH_S seconds, or at once for anything at ERROR and above.
+        handlers.append(_PeriodicMemoryHandler(file_handler, FILE_FLUSH_S))
 
     for handler in handlers:
         handler.setLevel(numeric_level)
-        root.addHandler(handler)
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    root.addHandler(logging.handlers.QueueHandler(records))
 
     root.setLevel(numeric_level)
     return root
 
 
+class _PeriodicMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes on a timer.
+
+    Without it a quiet run could leave INFO records sitting in the buffer
+    for minutes before anything fills it or an error arrives.
+    """
+
+    def __init__(self, target: logging.Handler, interval: float) -> None:
+        super().__init__(FILE_BUFFER, flushLevel=logging.ERROR, target=target)
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_every, args=(interval,), name="log-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_every(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            self.flush()
+
+    def flush(self) -> None:
+        super().flush()
+        target = self.target
+        if target is not None:
+            target.flush()
+
+    def close(self) -> None:
+        self._stopped.set()
+        super().close()
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that leaves flushing to whoever feeds it.
+
+    The stock handler flushes after every record and seeks to the end of
+    the file to check its size, so a batch from the MemoryHandler still
+    costs a write and an lseek per record. Here the file gets a 64 KiB
+    buffer and the size is tracked in memory; the file itself is only
+    consulted once that estimate reaches maxBytes.
+    """
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=FILE_IO_BUFFER,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        # Like the stock handler, never roll over /dev/null or a pipe.
+        self._regular = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def flush(self) -> None:
+        with self.lock:
+            super().flush()
+            if self.stream is not None:
+                # Pick up what other processes wrote since the last flush.
+                self._size = os.fstat(self.stream.fileno()).st_size
+
+    def _full(self, size: int) -> bool:
+        """Check the file itself before rolling over.
+
+        The dashboard and the crew it starts log to the same file, and
+        each only counts its own writes.
+        """
+        self.stream.flush()
+        try:
+            st = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            st = None
+        if st is None or st.st_ino != os.fstat(self.stream.fileno()).st_ino:
+            # The other process already rolled it over; follow it.
+            self.stream.close()
+            self.stream = self._open()
+        else:
+            self._size = st.st_size
+        return self._size + size >= self.maxBytes
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # maxBytes is in bytes; only non-ASCII text needs encoding to
+            # count them.
+            size = len(msg) if msg.isascii() else len(
+                msg.encode(self.encoding or "utf-8", self.errors or "strict")
+            )
+            if _NEWLINE_EXTRA:
+                size += msg.count("\n") * _NEWLINE_EXTRA
+            if (
+                self.maxBytes > 0
+                and self._regular
+                and self._size + size >= self.maxBytes
+                and self._full(size)
+            ):
+                self.doRollover()
+            self.stream.write(msg)
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _skip_unused_record_fields(fmt: str) -> None:
+    """Stop the stdlib collecting LogRecord fields that ``fmt`` never shows.
+
+    Caller lookup walks the stack on every record; thread and process
+    names cost a lookup each. These are process-wide switches, so they are
+    re-derived from the format on every setup call.
+    """
+    def uses(*fields: str) -> bool:
+        return any(f"%({name})" in fmt for name in fields)
+
+    logging._srcfile = (  # type: ignore[attr-defined]
+        os.path.normcase(logging.addLevelName.__code__.co_filename)
+        if uses("pathname", "filename", "module", "funcName", "lineno")
+        else None
+    )
+    logging.logThreads = uses("thread", "threadName")
+    logging.logProcesses = uses("process")
+    logging.logMultiprocessing = uses("processName")
+    if hasattr(logging, "logAsyncioTasks"):
+        logging.logAsyncioTasks = uses("taskName")
+
+
+def _open_log_file(path: Path) -> logging.handlers.RotatingFileHandler:
+    # The log directory almost always exists after the first run; only
+    # create it when opening the file says it's missing.
+    try:
+        return _BufferedRotatingFileHandler(path, **_ROTATION)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return _BufferedRotatingFileHandler(path, **_ROTATION)
+
+
+def _stop_listener() -> None:
+    """Flush queued records and close the listener's handlers."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        # MemoryHandler.close flushes but leaves its target open.
+        target = getattr(handler, "target", None)
+        for h in (handler, target) if target else (handler,):
+            try:
+                h.close()
+            except Exception:
+                pass
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
@@ -19,14 +19,14 @@ class ParallelTasks:
     file_lock: Task
 
     def as_list(self) -> list[Task]:
-        # NOTE: CrewAI requires the LAST task to be synchronous.
+        # Each task runs in its own single-task crew; see build_parallel_crew.
         return [
             self.frontend,
             self.backend,
             self.integration,
             self.qa,
             self.performance,
-            self.file_lock,  # async_execution=False
+            self.file_lock,
         ]
 
 
@@ -44,7 +44,6 @@ def build_parallel_tasks(agents: ParallelAgents) -> ParallelTasks:
             "communication hub, and review requests recorded."
         ),
         agent=agents.frontend,
-        async_execution=True,
     )
 
     backend = Task(
@@ -59,19 +58,19 @@ def build_parallel_tasks(agents: ParallelAgents) -> ParallelTasks:
             "via integration_coordinator, and testing hooks for QA."
         ),
         agent=agents.backend,
-        async_execution=True,
     )
 
     integration = Task(
         description=(
-            "Coordinate the team under Game/integration/. Track dependencies, "
-            "monitor progress, and resolve conflicts.\n"
+            "Coordinate the team under Game/integration/. There is no crew "
+            "manager: every other agent works concurrently, so track "
+            "dependencies, monitor progress, and resolve conflicts through the "
+            "team_communication, integration_coordinator and project_status tools.\n"
             "Files: coordinator.py, dependency_manager.py, communication_hub.py, "
             "conflict_resolver.py, project_status.py."
         ),
         expected_output="Integration module with dependency graph and conflict log.",
         agent=agents.integration,
-        async_execution=True,
     )
 
     qa = Task(
@@ -83,7 +82,6 @@ def build_parallel_tasks(agents: ParallelAgents) -> ParallelTasks:
         ),
         expected_output="QA module with bug tracker entries linked to commits.",
         agent=agents.qa,
-        async_execution=True,
     )
 
     performance = Task(
@@ -93,7 +91,6 @@ def build_parallel_tasks(agents: ParallelAgents) -> ParallelTasks:
         ),
         expected_output="Performance module with benchmark results and recommendations.",
         agent=agents.performance,
-        async_execution=True,
     )
 
     file_lock = Task(
@@ -105,8 +102,6 @@ def build_parallel_tasks(agents: ParallelAgents) -> ParallelTasks:
         ),
         expected_output="File-lock manager module with audit trail and access policies.",
         agent=agents.file_lock_manager,
-        # MUST be sync — CrewAI requires the final task to be synchronous.
-        async_execution=False,
     )
 
     return ParallelTasks(
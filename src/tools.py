@@ -12,7 +12,7 @@ Replacement for collaborative_tools.py. Bug fixes vs the original:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, ClassVar
 
 from crewai.tools.base_tool import BaseTool
 
@@ -39,16 +39,22 @@ class CollaborativeFileWriterTool(BaseTool):
         try:
             with hub.file_lock(agent_name, str(path)):
                 action = "modified" if path.exists() else "created"
-                _safe_mkdir(path)
-                path.write_text(content, encoding="utf-8")
-                hub.send_message(
-                    agent_name, "all", f"{action} {path}", "file_change"
-                )
-                hub.update_status(
-                    agent_name,
-                    f"{action} {path}",
-                    {"file": str(path), "lines": content.count("\n") + 1, "action": action},
-                )
+                try:
+                    path.write_text(content, encoding="utf-8")
+                except FileNotFoundError:
+                    # Parent directory is missing; agents mostly write into
+                    # existing trees, so only pay for mkdir on the miss.
+                    _safe_mkdir(path)
+                    path.write_text(content, encoding="utf-8")
+            # The write is done and the lock released; the team notification
+            # doesn't need to land before the agent gets its answer.
+            hub.announce_later(
+                agent_name,
+                f"{action} {path}",
+                f"{action} {path}",
+                kind="file_change",
+                details={"file": str(path), "lines": content.count("\n") + 1, "action": action},
+            )
             return f"OK: {action} {path}"
         except FileLockError as exc:
             logger.warning("%s", exc)
@@ -69,49 +75,61 @@ class TeamCommunicationTool(BaseTool):
 
     def _run(self, action: str, **kwargs: Any) -> str:
         hub = default_hub()
+        handler = self._actions.get(action)
         try:
-            if action == "send_message":
-                hub.send_message(
-                    kwargs.get("from_agent", "agent"),
-                    kwargs.get("to_agent", "all"),
-                    kwargs.get("message", ""),
-                    kwargs.get("type", "info"),
-                )
-                return "OK: message sent"
-
-            if action == "get_messages":
-                msgs = hub.get_messages(kwargs.get("agent_name", "agent"))
-                if not msgs:
-                    return "No new messages"
-                lines = []
-                for m in msgs:
-                    lines.append(f"- {m['from_agent']}: {m['message']}")
-                    hub.mark_read(m["id"])
-                return "\n".join(lines)
-
-            if action == "request_review":
-                hub.send_message(
-                    kwargs.get("from_agent", "agent"),
-                    kwargs.get("reviewer", "qa_engineer"),
-                    f"please review {kwargs.get('file_path', '<unknown>')}",
-                    "code_review_request",
-                )
-                return "OK: review requested"
-
-            if action == "share_progress":
-                agent = kwargs.get("agent_name", "agent")
-                progress = kwargs.get("progress", "")
-                hub.update_status(agent, progress, kwargs.get("details") or {})
-                hub.send_message(agent, "all", f"progress: {progress}", "progress")
-                return "OK: progress shared"
-
-            # Treat the action string as a free-form broadcast.
-            hub.send_message(kwargs.get("from_agent", "agent"), "all", action, "info")
-            return "OK: broadcast sent"
+            if handler is None:
+                # Treat the action string as a free-form broadcast.
+                hub.send_message(kwargs.get("from_agent", "agent"), "all", action, "info")
+                return "OK: broadcast sent"
+            return handler(self, hub, kwargs)
         except CrewAIError as exc:
             logger.error("%s", exc)
             return f"ERROR [{exc.code.code}]: {exc}"
 
+    def _send_message(self, hub: CommunicationHub, kwargs: dict[str, Any]) -> str:
+        hub.send_message(
+            kwargs.get("from_agent", "agent"),
+            kwargs.get("to_agent", "all"),
+            kwargs.get("message", ""),
+            kwargs.get("type", "info"),
+        )
+        return "OK: message sent"
+
+    def _get_messages(self, hub: CommunicationHub, kwargs: dict[str, Any]) -> str:
+        msgs = hub.get_messages(kwargs.get("agent_name", "agent"))
+        if not msgs:
+            return "No new messages"
+        hub.mark_messages_read(m["id"] for m in msgs)
+        return "\n".join(f"- {m['from_agent']}: {m['message']}" for m in msgs)
+
+    def _request_review(self, hub: CommunicationHub, kwargs: dict[str, Any]) -> str:
+        hub.send_message(
+            kwargs.get("from_agent", "agent"),
+            kwargs.get("reviewer", "qa_engineer"),
+            f"please review {kwargs.get('file_path', '<unknown>')}",
+            "code_review_request",
+        )
+        return "OK: review requested"
+
+    def _share_progress(self, hub: CommunicationHub, kwargs: dict[str, Any]) -> str:
+        agent = kwargs.get("agent_name", "agent")
+        progress = kwargs.get("progress", "")
+        hub.announce(
+            agent,
+            progress,
+            f"progress: {progress}",
+            kind="progress",
+            details=kwargs.get("details") or {},
+        )
+        return "OK: progress shared"
+
+    _actions: ClassVar[dict[str, Callable[..., str]]] = {
+        "send_message": _send_message,
+        "get_messages": _get_messages,
+        "request_review": _request_review,
+        "share_progress": _share_progress,
+    }
+
 
 class IntegrationCoordinatorTool(BaseTool):
     name: str = "integration_coordinator"
@@ -121,40 +139,47 @@ class IntegrationCoordinatorTool(BaseTool):
 
     def _run(self, action: str, **kwargs: Any) -> str:
         hub = default_hub()
+        handler = self._actions.get(action)
         try:
-            if action == "register_interface":
-                hub.report_integration_point(
-                    kwargs.get("agent_name", "agent"),
-                    kwargs.get("component", ""),
-                    kwargs.get("interface") or {},
-                )
-                return f"OK: interface registered for {kwargs.get('component', '?')}"
-
-            if action == "check_dependencies":
-                target = kwargs.get("component", "")
-                points = hub.snapshot().get("integration_points", [])
-                deps = [
-                    p for p in points
-                    if target in (p.get("interface") or {}).get("dependencies", [])
-                ]
-                if not deps:
-                    return f"OK: no dependencies for {target}"
-                return "\n".join(f"- {d['component']} by {d['agent']}" for d in deps)
-
-            if action == "report_conflict":
-                hub.report_conflict(
-                    kwargs.get("agent_name", "agent"),
-                    kwargs.get("conflict", "unspecified"),
-                    kwargs.get("details") or {},
+            if handler is None:
+                hub.send_message(
+                    kwargs.get("agent_name", "agent"), "all", f"integration: {action}", "integration"
                 )
-                return "OK: conflict reported"
-
-            hub.send_message(kwargs.get("agent_name", "agent"), "all", f"integration: {action}", "integration")
-            return "OK: integration broadcast sent"
+                return "OK: integration broadcast sent"
+            return handler(self, hub, kwargs)
         except CrewAIError as exc:
             logger.error("%s", exc)
             return f"ERROR [{exc.code.code}]: {exc}"
 
+    def _register_interface(self, hub: CommunicationHub, kwargs: dict[str, Any]) -> str:
+        hub.report_integration_point(
+            kwargs.get("agent_name", "agent"),
+            kwargs.get("component", ""),
+            kwargs.get("interface") or {},
+        )
+        return f"OK: interface registered for {kwargs.get('component', '?')}"
+
+    def _check_dependencies(self, hub: CommunicationHub, kwargs: dict[str, Any]) -> str:
+        target = kwargs.get("component", "")
+        deps = hub.points_depending_on(target)
+        if not deps:
+            return f"OK: no dependencies for {target}"
+        return "\n".join(f"- {d.component} by {d.agent}" for d in deps)
+
+    def _report_conflict(self, hub: CommunicationHub, kwargs: dict[str, Any]) -> str:
+        hub.report_conflict(
+            kwargs.get("agent_name", "agent"),
+            kwargs.get("conflict", "unspecified"),
+            kwargs.get("details") or {},
+        )
+        return "OK: conflict reported"
+
+    _actions: ClassVar[dict[str, Callable[..., str]]] = {
+        "register_interface": _register_interface,
+        "check_dependencies": _check_dependencies,
+        "report_conflict": _report_conflict,
+    }
+
 
 class ProjectStatusTool(BaseTool):
     name: str = "project_status"
@@ -162,32 +187,38 @@ class ProjectStatusTool(BaseTool):
 
     def _run(self, action: str = "team_status", **_: Any) -> str:
         hub = default_hub()
+        # Unknown actions fall back to team_status.
+        handler = self._actions.get(action, ProjectStatusTool._team_status)
         try:
-            data = hub.snapshot()
-            if action == "file_status":
-                locks = data.get("file_locks", {})
-                if not locks:
-                    return "No files locked"
-                return "\n".join(f"- {p} locked by {info['agent']}" for p, info in locks.items())
-
-            if action == "integration_status":
-                points = data.get("integration_points", [])[-10:]
-                if not points:
-                    return "No integration points"
-                return "\n".join(f"- {p['component']} ({p['agent']})" for p in points)
-
-            # default = team_status
-            updates = data.get("status_updates", [])[-20:]
-            if not updates:
-                return "No status updates"
-            latest: dict[str, dict[str, Any]] = {}
-            for u in updates:
-                latest[u["agent"]] = u
-            return "\n".join(f"- {a}: {u['status']}" for a, u in latest.items())
+            return handler(self, hub)
         except CrewAIError as exc:
             logger.error("%s", exc)
             return f"ERROR [{exc.code.code}]: {exc}"
 
+    def _file_status(self, hub: CommunicationHub) -> str:
+        locks = hub.get_file_locks()
+        if not locks:
+            return "No files locked"
+        return "\n".join(f"- {p} locked by {info['agent']}" for p, info in locks.items())
+
+    def _integration_status(self, hub: CommunicationHub) -> str:
+        points = hub.snapshot().get("integration_points", [])[-10:]
+        if not points:
+            return "No integration points"
+        return "\n".join(f"- {p['component']} ({p['agent']})" for p in points)
+
+    def _team_status(self, hub: CommunicationHub) -> str:
+        latest = hub.latest_status()
+        if not latest:
+            return "No status updates"
+        return "\n".join(f"- {a}: {u['status']}" for a, u in latest.items())
+
+    _actions: ClassVar[dict[str, Callable[..., str]]] = {
+        "team_status": _team_status,
+        "file_status": _file_status,
+        "integration_status": _integration_status,
+    }
+
 
 def make_collab_toolset(hub: CommunicationHub | None = None) -> list[BaseTool]:
     """Tools share the default hub unless one is passed (mainly for tests)."""
@@ -30,7 +30,7 @@ echo   v2.0  ^|  unified launcher
 echo ================================================================
 echo.
 echo   1^) Sequential development (4 agents, simple, fastest)
-echo   2^) Parallel collaborative (6 agents, hierarchical)
+echo   2^) Parallel collaborative (6 agents, concurrent)
 echo   3^) Dashboard only (monitor an existing run)
 echo   4^) Full launch (parallel agents + live dashboard)
 echo   5^) Exit
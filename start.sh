@@ -24,7 +24,7 @@ print_menu() {
 ================================================================
 
   1) Sequential development (4 agents, simple, fastest)
-  2) Parallel collaborative (6 agents, hierarchical)
+  2) Parallel collaborative (6 agents, concurrent)
   3) Dashboard only (monitor an existing run)
   4) Full launch (parallel agents + live dashboard)
   5) Exit
@@ -36,10 +36,10 @@ print_menu
 read -rp "Enter choice [1-5]: " choice
 
 case "${choice}" in
-    1) "${PYTHON}" -m src.cli --mode sequential --no-menu ;;
-    2) "${PYTHON}" -m src.cli --mode parallel   --no-menu ;;
-    3) "${PYTHON}" -m src.cli --mode dashboard  --no-menu ;;
-    4) "${PYTHON}" -m src.cli --mode full       --no-menu ;;
+    1) exec "${PYTHON}" -m src.cli --mode sequential --no-menu ;;
+    2) exec "${PYTHON}" -m src.cli --mode parallel   --no-menu ;;
+    3) exec "${PYTHON}" -m src.cli --mode dashboard  --no-menu ;;
+    4) exec "${PYTHON}" -m src.cli --mode full       --no-menu ;;
     5) exit 0 ;;
     *) echo "Invalid choice: ${choice}" >&2; exit 1 ;;
 esac
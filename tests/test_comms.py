@@ -0,0 +1,149 @@
+"""CommunicationHub tests. Run with ``python -m unittest discover -s tests``."""
+
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from src.comms import CommunicationHub
+
+
+def _in_thread(fn, timeout: float = 5.0):
+    """Run ``fn`` in a thread so a lock deadlock fails the test instead of hanging it."""
+    result: dict = {}
+
+    def run() -> None:
+        try:
+            result["value"] = fn()
+        except BaseException as exc:  # noqa: BLE001 - re-raised below
+            result["error"] = exc
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise AssertionError(f"call did not finish within {timeout}s")
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+
+class _HubTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.hub = CommunicationHub(state_file=Path(self._tmp.name) / "state.json")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+
+class BatchTest(_HubTestCase):
+    def test_reads_inside_batch_see_pending_writes(self) -> None:
+        hub = self.hub
+
+        def body() -> tuple:
+            with hub.batch():
+                hub.send_message("a", "b", "x1")
+                hub.update_status("a", "working")
+                with hub.file_lock("a", "f.py"):
+                    holder = hub.lock_holder("f.py")
+                return (
+                    [m["message"] for m in hub.get_messages("b")],
+                    hub.latest_status()["a"]["status"],
+                    holder,
+                )
+
+        messages, status, holder = _in_thread(body)
+        self.assertEqual(messages, ["x1"])
+        self.assertEqual(status, "working")
+        self.assertEqual(holder, "a")
+        self.assertEqual([m["message"] for m in hub.get_messages("b")], ["x1"])
+
+    def test_batch_writes_nothing_when_block_raises(self) -> None:
+        hub = self.hub
+
+        def body() -> None:
+            with hub.batch():
+                hub.send_message("a", "b", "lost")
+                raise ValueError
+
+        with self.assertRaises(ValueError):
+            _in_thread(body)
+        self.assertEqual(hub.get_messages("b"), [])
+
+    def test_retry_after_rolled_back_batch_is_written(self) -> None:
+        hub = self.hub
+
+        def body() -> None:
+            with hub.batch():
+                hub.send_message("a", "b", "retry me")
+                raise ValueError
+
+        with self.assertRaises(ValueError):
+            _in_thread(body)
+        msg_id = hub.send_message("a", "b", "retry me")
+        self.assertEqual([m["id"] for m in hub.get_messages("b")], [msg_id])
+
+
+class DedupTest(_HubTestCase):
+    def test_repeated_announce_writes_once(self) -> None:
+        hub = self.hub
+        first = hub.announce("a", "modified f.py", "modified f.py", kind="file_change")
+        again = hub.announce("a", "modified f.py", "modified f.py", kind="file_change")
+        self.assertEqual(first, again)
+        self.assertEqual(len(hub.snapshot()["communications"]), 1)
+        self.assertEqual(len(hub.snapshot()["status_updates"]), 1)
+
+    def test_announce_after_window_writes_again(self) -> None:
+        hub = self.hub
+        hub.dedup_window_s = 0.0
+        hub.announce("a", "modified f.py", "modified f.py", kind="file_change")
+        hub.announce("a", "modified f.py", "modified f.py", kind="file_change")
+        self.assertEqual(len(hub.snapshot()["communications"]), 2)
+
+    def test_changed_status_is_not_suppressed(self) -> None:
+        hub = self.hub
+        hub.announce("a", "working", "same note")
+        hub.announce("a", "done", "same note")
+        self.assertEqual(hub.latest_status()["a"]["status"], "done")
+
+
+
+class ReadAndDependencyTest(_HubTestCase):
+    def test_mark_messages_read_counts_marked_messages(self) -> None:
+        hub = self.hub
+        ids = [hub.send_message("a", "b", f"m{i}") for i in range(3)]
+        self.assertEqual(hub.mark_messages_read(ids[:2] + ["missing"]), 2)
+        self.assertEqual([m["id"] for m in hub.get_messages("b")], ids[2:])
+        self.assertEqual(hub.mark_messages_read([]), 0)
+
+    def test_points_depending_on_follows_new_points(self) -> None:
+        hub = self.hub
+        hub.report_integration_point("a", "ui", {"dependencies": ["engine", "store"]})
+        self.assertEqual([p.component for p in hub.points_depending_on("engine")], ["ui"])
+        hub.report_integration_point("b", "save", {"dependencies": ["store"]})
+        self.assertEqual(
+            [(p.agent, p.component) for p in hub.points_depending_on("store")],
+            [("a", "ui"), ("b", "save")],
+        )
+        self.assertEqual(hub.points_depending_on("nothing"), [])
+
+
+class GetterTest(_HubTestCase):
+    def test_getters_return_copies_of_the_cached_snapshot(self) -> None:
+        hub = self.hub
+        hub.announce("a", "working", "hello", recipient="b")
+        hub.acquire_lock("a", "f.py")
+        hub.get_status("a")[0]["status"] = "tampered"
+        hub.get_messages("b")[0]["read"] = True
+        hub.get_file_locks()["f.py"]["agent"] = "z"
+        hub.get_status().clear()
+        self.assertEqual(hub.latest_status()["a"]["status"], "working")
+        self.assertEqual(len(hub.get_messages("b")), 1)
+        self.assertEqual(hub.lock_holder("f.py"), "a")
+        self.assertEqual(len(hub.snapshot()["status_updates"]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
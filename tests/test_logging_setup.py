@@ -0,0 +1,71 @@
+"""Log handler tests. Run with ``python -m unittest discover -s tests``."""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.logging_setup import _BufferedRotatingFileHandler
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+
+
+class BufferedRotatingFileHandlerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "test.log"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _handler(self, max_bytes: int) -> _BufferedRotatingFileHandler:
+        handler = _BufferedRotatingFileHandler(
+            self.path, maxBytes=max_bytes, backupCount=2, encoding="utf-8"
+        )
+        self.addCleanup(handler.close)
+        return handler
+
+    def _sizes(self) -> dict[str, int]:
+        return {p.name: p.stat().st_size for p in Path(self._tmp.name).iterdir()}
+
+    def test_rolls_over_before_exceeding_max_bytes(self) -> None:
+        handler = self._handler(100)
+        for _ in range(6):
+            handler.emit(_record("x" * 29))  # 30 bytes with the newline
+        handler.flush()
+        sizes = self._sizes()
+        self.assertEqual(sorted(sizes), ["test.log", "test.log.1"])
+        self.assertTrue(all(size <= 100 for size in sizes.values()), sizes)
+
+    def test_counts_bytes_not_characters(self) -> None:
+        handler = self._handler(100)
+        for _ in range(4):
+            handler.emit(_record("é" * 20))  # 40 bytes, 21 characters
+        handler.flush()
+        self.assertTrue(all(size <= 100 for size in self._sizes().values()))
+
+    def test_sees_writes_from_another_handler(self) -> None:
+        first, second = self._handler(100), self._handler(100)
+        for i in range(10):
+            writer, other = (first, second) if i % 2 else (second, first)
+            writer.emit(_record("x" * 29))
+            writer.flush()
+            other.flush()
+        sizes = self._sizes()
+        self.assertTrue(all(size <= 100 for size in sizes.values()), sizes)
+
+    def test_never_rolls_over_non_regular_files(self) -> None:
+        handler = _BufferedRotatingFileHandler(os.devnull, maxBytes=10, backupCount=1)
+        self.addCleanup(handler.close)
+        for _ in range(5):
+            handler.emit(_record("x" * 29))
+        self.assertTrue(os.path.exists(os.devnull))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""DashboardState tests. Run with ``python -m unittest discover -s tests``."""
+
+from __future__ import annotations
+
+import unittest
+
+from src.dashboard.state import DashboardState, TailWindow
+
+
+def _entries(*ids: int) -> list[dict]:
+    return [{"id": str(i)} for i in ids]
+
+
+class TailWindowTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.window = TailWindow(3, lambda e: e["id"], lambda e: e["id"])
+
+    def test_appends_only_new_entries(self) -> None:
+        self.window.ingest(_entries(1, 2))
+        self.window.ingest(_entries(1, 2, 3))
+        self.assertEqual(self.window.view, (3, ("1", "2", "3")))
+
+    def test_keeps_only_the_last_size_entries(self) -> None:
+        self.window.ingest(_entries(1, 2))
+        self.window.ingest(_entries(1, 2, 3, 4, 5))
+        self.assertEqual(self.window.view, (5, ("3", "4", "5")))
+
+    def test_unchanged_entries_keep_the_version(self) -> None:
+        self.window.ingest(_entries(1, 2))
+        view = self.window.view
+        self.window.ingest(_entries(1, 2))
+        self.assertIs(self.window.view, view)
+
+    def test_rebuild_bumps_version_past_size(self) -> None:
+        self.window.ingest(_entries(1, 2))
+        # The hub trimmed away the last entry the window saw.
+        self.window.ingest(_entries(7, 8))
+        version, items = self.window.view
+        self.assertEqual(items, ("7", "8"))
+        self.assertGreaterEqual(version - 2, self.window.size)
+
+
+class StatusIngestTest(unittest.TestCase):
+    def test_folds_new_updates_per_agent(self) -> None:
+        state = DashboardState()
+        first = [
+            {"timestamp": "t1", "agent": "a", "status": "working"},
+            {"timestamp": "t2", "agent": "b", "status": "idle"},
+        ]
+        state.ingest_status_updates(first)
+        published = state.latest_status
+        state.ingest_status_updates(first + [{"timestamp": "t3", "agent": "a", "status": "done"}])
+        self.assertEqual(state.status_version, 2)
+        self.assertEqual(state.latest_status["a"]["status"], "done")
+        self.assertEqual(state.latest_status["b"]["status"], "idle")
+        # Copy-on-write: the dict the Tk thread may be iterating is untouched.
+        self.assertEqual(published["a"]["status"], "working")
+
+    def test_no_new_updates_keep_the_version(self) -> None:
+        state = DashboardState()
+        updates = [{"timestamp": "t1", "agent": "a", "status": "working"}]
+        state.ingest_status_updates(updates)
+        state.ingest_status_updates(updates)
+        self.assertEqual(state.status_version, 1)
+
+    def test_trimmed_history_is_rebuilt(self) -> None:
+        state = DashboardState()
+        state.ingest_status_updates([{"timestamp": "t1", "agent": "a", "status": "working"}])
+        state.ingest_status_updates([{"timestamp": "t9", "agent": "b", "status": "idle"}])
+        self.assertEqual(list(state.latest_status), ["b"])
+
+
+if __name__ == "__main__":
+    unittest.main()